@@ -8,7 +8,7 @@ except ImportError:
     pass
 
 from .proxies import SessionProxy as Session
-from .strategy import Strategy
+from .strategy import SignalStrategy, Strategy, TargetPositionStrategy
 from .system import Cipher
 from .values import base, percent, quote
 
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 import typer
 
@@ -34,3 +35,20 @@ def new(name: str, template: Template = Template.default):
     use_case = container.create_strategy()
 
     use_case.call(name=name, template=template)
+
+
+@app.command()
+def compact(
+    slug: Optional[str] = typer.Argument(
+        default=None, help="Source slug, all the cached sources by default."
+    ),
+):
+    """Merge cached data chunks into monthly segments."""
+    container = Container()
+    container.config.from_dict(Settings().model_dump())
+    container.init_resources()
+    data_service = container.data_service()
+
+    removed = data_service.compact(prefix=slug)
+
+    typer.echo(f"Removed {removed} chunks.")
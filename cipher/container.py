@@ -14,7 +14,12 @@ class Container(containers.DeclarativeContainer):
 
     templates_root = providers.Object(Path(__file__).parent / "templates")
 
-    data_service = providers.Singleton(DataService, cache_root=config.cache_root)
+    data_service = providers.Singleton(
+        DataService,
+        cache_root=config.cache_root,
+        compression=config.cache_compression,
+        jobs=config.fetch_jobs,
+    )
 
     init_repository = providers.Factory(InitRepository, templates_root=templates_root)
     create_strategy = providers.Factory(CreateStrategy, templates_root=templates_root)
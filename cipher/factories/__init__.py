@@ -1,3 +1,11 @@
+from .excursions import ExcursionsFactory
+from .monte_carlo import MonteCarloFactory
 from .stats import StatsFactory
+from .vector_stats import VectorStatsFactory
 
-__all__ = ("StatsFactory",)
+__all__ = (
+    "ExcursionsFactory",
+    "MonteCarloFactory",
+    "StatsFactory",
+    "VectorStatsFactory",
+)
@@ -0,0 +1,76 @@
+import numpy as np
+from pandas import DataFrame
+
+from cipher.models import Output
+
+
+class ExcursionsFactory:
+    """Maximum adverse and favourable excursion of each closed session.
+
+    Excursions are price distances from the entry price to the worst and
+    the best low/high over the bars after the open bar up to the close bar,
+    mae_i and mfe_i are the dataframe row positions where they happened.
+    They are zero, at the open bar, if the price never moved that way."""
+
+    def from_output(self, output: Output) -> DataFrame:
+        sessions = output.sessions.closed_sessions
+        df = output.df
+
+        timestamps = df.index.values.astype("datetime64[s]").astype("int64")
+        opened_ts = np.fromiter((s.opened_ts for s in sessions), dtype=np.int64)
+        closed_ts = np.fromiter((s.closed_ts for s in sessions), dtype=np.int64)
+        is_long = np.fromiter((s.is_long for s in sessions), dtype=bool)
+        price = np.fromiter(
+            (s.transactions[0].price for s in sessions), dtype=np.float64
+        )
+
+        open_i = np.searchsorted(timestamps, opened_ts)
+        close_i = np.searchsorted(timestamps, closed_ts)
+        start = np.minimum(open_i + 1, close_i)
+
+        lows = df["low"].to_numpy(dtype=np.float64)
+        highs = df["high"].to_numpy(dtype=np.float64)
+        low_i = self._extreme_i(lows, start=start, stop=close_i, ufunc=np.minimum)
+        high_i = self._extreme_i(highs, start=start, stop=close_i, ufunc=np.maximum)
+        low = lows[low_i]
+        high = highs[high_i]
+
+        # sessions closed on the open bar have no bars after the entry
+        has_bars = close_i > open_i
+        adverse = np.where(has_bars, np.where(is_long, price - low, high - price), 0)
+        adverse_i = np.where(is_long, low_i, high_i)
+        favourable = np.where(has_bars, np.where(is_long, high - price, price - low), 0)
+        favourable_i = np.where(is_long, high_i, low_i)
+
+        return DataFrame(
+            {
+                "opened_ts": opened_ts.astype("datetime64[s]"),
+                "closed_ts": closed_ts.astype("datetime64[s]"),
+                "is_long": is_long,
+                "price": price,
+                "mae": np.maximum(adverse, 0.0),
+                "mae_i": np.where(adverse > 0, adverse_i, open_i),
+                "mfe": np.maximum(favourable, 0.0),
+                "mfe_i": np.where(favourable > 0, favourable_i, open_i),
+            }
+        )
+
+    @staticmethod
+    def _extreme_i(
+        values: np.ndarray, start: np.ndarray, stop: np.ndarray, ufunc: np.ufunc
+    ) -> np.ndarray:
+        """Row of the first extreme value in each [start, stop] segment."""
+        if not len(start):
+            return np.empty(0, dtype=np.int64)
+
+        # segments overlap, so they are laid out one after another
+        lengths = stop - start + 1
+        offsets = np.r_[0, np.cumsum(lengths)[:-1]]
+        rows = np.arange(lengths.sum()) - np.repeat(offsets - start, lengths)
+
+        segment_values = values[rows]
+        extremes = ufunc.reduceat(segment_values, offsets)
+        is_extreme = segment_values == np.repeat(extremes, lengths)
+        positions = np.where(is_extreme, np.arange(len(rows)), len(rows))
+
+        return rows[np.minimum.reduceat(positions, offsets)]
@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from typing import Optional
+
+import numpy as np
+from pandas import DataFrame
+
+from cipher.models import Commission, Output
+
+METHODS = ("shuffle", "block")
+
+
+class MonteCarloFactory:
+    """Distributions of final pnl, max drawdown and longest losing streak
+    over random orderings of closed session pnls.
+
+    "shuffle" permutes the sessions, "block" is a circular block bootstrap,
+    it resamples runs of block_size sessions with replacement and keeps
+    the short-term dependency between them. Paths are generated as one matrix
+    per batch, batches run in worker processes if jobs > 1."""
+
+    def __init__(
+        self,
+        commission: Optional[Commission],
+        paths: int = 10000,
+        method: str = "shuffle",
+        block_size: int = 5,
+        batch_size: int = 1000,
+        jobs: Optional[int] = 1,
+        seed: Optional[int] = None,
+    ):
+        if method not in METHODS:
+            raise ValueError(f"Unknown method {method}, use one of {METHODS}.")
+        if block_size < 1:
+            raise ValueError("Block size has to be positive.")
+
+        self.commission = commission
+        self.paths = paths
+        self.method = method
+        self.block_size = block_size
+        self.batch_size = batch_size
+        self.jobs = jobs or os.cpu_count()
+        self.seed = seed
+
+    def from_output(self, output: Output) -> DataFrame:
+        """A row for each path."""
+        ledger = output.ledger.filter(attrgetter("is_closed"))
+        quote = ledger.quote
+        if self.commission and len(ledger):
+            quote = quote - self.commission.for_ledger(ledger)
+        pnls = np.bincount(
+            ledger.session_id, weights=quote, minlength=len(ledger.sessions)
+        )
+
+        sizes = [
+            min(self.batch_size, self.paths - start)
+            for start in range(0, self.paths, self.batch_size)
+        ]
+        # a seed per batch, results do not depend on jobs
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        batches = [(pnls, size, seed) for size, seed in zip(sizes, seeds)]
+
+        if self.jobs == 1 or len(batches) < 2:
+            results = [self._run_batch(batch) for batch in batches]
+        else:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                results = list(executor.map(self._run_batch, batches))
+
+        return DataFrame(
+            np.concatenate(results) if results else np.empty((0, 3)),
+            columns=["pnl", "drawdown_max", "failure_row_max"],
+        ).astype({"failure_row_max": np.int64})
+
+    def _run_batch(self, batch) -> np.ndarray:
+        pnls, size, seed = batch
+        rng = np.random.default_rng(seed)
+        matrix = self._resample(pnls, size=size, rng=rng)
+
+        balance = np.cumsum(matrix, axis=1)
+        # the balance starts at zero
+        peak = np.maximum(np.maximum.accumulate(balance, axis=1), 0.0)
+        drawdown_max = (peak - balance).max(axis=1, initial=0.0)
+
+        # losing streak length at each session: losses so far minus losses
+        # before the last success
+        failures = matrix <= 0
+        failures_n = np.cumsum(failures, axis=1)
+        streak = failures_n - np.maximum.accumulate(
+            np.where(failures, 0, failures_n), axis=1
+        )
+
+        return np.column_stack(
+            (
+                balance[:, -1] if len(pnls) else np.zeros(size),
+                drawdown_max,
+                streak.max(axis=1, initial=0),
+            )
+        )
+
+    def _resample(
+        self, pnls: np.ndarray, size: int, rng: np.random.Generator
+    ) -> np.ndarray:
+        n = len(pnls)
+        if not n:
+            return np.empty((size, 0))
+        if self.method == "shuffle":
+            return pnls[rng.random((size, n)).argsort(axis=1)]
+
+        blocks_n = -(-n // self.block_size)
+        starts = rng.integers(0, n, size=(size, blocks_n))
+        indexes = (starts[:, :, None] + np.arange(self.block_size)) % n
+        return pnls[indexes.reshape(size, -1)[:, :n]]
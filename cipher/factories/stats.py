@@ -1,30 +1,52 @@
+import math
 from decimal import Decimal
 from statistics import median
-from typing import Optional
+from typing import Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
-from cipher.models import Commission, Output, Stats, Time, TimeDelta, Wallet
+from cipher.models import (
+    Commission,
+    Interval,
+    Output,
+    Stats,
+    Time,
+    TimeDelta,
+    Wallet,
+)
+from cipher.utils import get_numeric, use_numeric
+
+
+# crypto markets trade every day
+YEAR = 365 * 24 * 3600
 
 
 class StatsFactory:
-    def __init__(self, commission: Optional[Commission]):
+    def __init__(
+        self,
+        commission: Optional[Commission],
+        capital: Union[Decimal, int, str, None] = None,
+    ):
+        """Returns are relative to capital if it is set,
+        otherwise they are balance changes in quote."""
         self.commission = commission
+        self.capital = float(capital) if capital is not None else None
 
     def from_output(self, output: Output) -> Stats:
-        if len(output.df.index):
-            start_ts = Time.from_datetime(output.df.index[0])
-            stop_ts = Time.from_datetime(output.df.index[-1])
-        else:
-            start_ts = Time(0)
-            stop_ts = Time(0)
+        # numbers of the output are summed and validated by its numeric
+        with use_numeric(output.numeric):
+            return self._from_output(output)
+
+    def _from_output(self, output: Output) -> Stats:
+        start_ts, stop_ts = self._bounds(output)
 
         sessions = output.sessions.closed_sessions
 
         wallet = Wallet()
         wallet_no_commission = Wallet()
 
-        volume = Decimal(0)
+        volume = get_numeric().zero
 
         success = []
         failure = []
@@ -72,32 +94,10 @@ class StatsFactory:
 
         period = stop_ts - start_ts
 
-        if output.sessions:
-            balance_df = self._balance_df(output=output)
-            balance = balance_df["balance"]
-            balance_min = balance.min()
-            balance_max = balance.max()
-            balance_drawdown_max = abs((balance - balance.cummax()).min())
-            romad = (
-                balance.iat[-1] / balance_drawdown_max if balance_drawdown_max else None
-            )
-            exposed_period = period * (
-                1
-                - len(balance_df["position"][balance_df["position"] == 0])
-                / len(balance_df)
-            )
-        else:
-            balance_min = Decimal(0)
-            balance_max = Decimal(0)
-            balance_drawdown_max = Decimal(0)
-            romad = None
-            exposed_period = TimeDelta(0)
-
         return Stats(
             start_ts=start_ts,
             stop_ts=stop_ts,
             period=period,
-            exposed_period=exposed_period,
             sessions_n=len(sessions),
             success_n=len(success),
             failure_n=len(failure),
@@ -114,39 +114,137 @@ class StatsFactory:
             commission=wallet_no_commission.quote - wallet.quote,
             session_period_max=max(periods) if periods else None,
             session_period_median=median(periods) if periods else None,
-            balance_min=balance_min,
-            balance_max=balance_max,
-            balance_drawdown_max=balance_drawdown_max,
-            romad=romad,
+            **self._balance_stats(output=output, period=period),
         )
 
-    def _balance_df(self, output: Output) -> pd.DataFrame:
-        df = output.df
-
-        position_col = "_position"
-        quote_col = "_quote"
-
-        df[position_col] = pd.Series(dtype="float64")
-        df[quote_col] = pd.Series(dtype="float64")
+    def _bounds(self, output: Output) -> Tuple[Time, Time]:
+        if len(output.df.index):
+            return (
+                Time.from_datetime(output.df.index[0]),
+                Time.from_datetime(output.df.index[-1]),
+            )
+        return Time(0), Time(0)
+
+    def _balance_stats(self, output: Output, period: TimeDelta) -> dict:
+        if not output.sessions:
+            return {
+                "balance_min": get_numeric().zero,
+                "balance_max": get_numeric().zero,
+                "balance_drawdown_max": get_numeric().zero,
+                "romad": None,
+                "exposed_period": TimeDelta(0),
+                **self._risk_stats(balance=None, index=output.df.index),
+            }
+
+        balance_df = self._balance_df(output=output)
+        balance = balance_df["balance"]
+        balance_drawdown_max = abs((balance - balance.cummax()).min())
+
+        return {
+            "balance_min": balance.min(),
+            "balance_max": balance.max(),
+            "balance_drawdown_max": balance_drawdown_max,
+            "romad": (
+                balance.iat[-1] / balance_drawdown_max if balance_drawdown_max else None
+            ),
+            "exposed_period": period
+            * (
+                1
+                - len(balance_df["position"][balance_df["position"] == 0])
+                / len(balance_df)
+            ),
+            **self._risk_stats(balance=balance.to_numpy(), index=output.df.index),
+        }
+
+    def _risk_stats(
+        self, balance: Optional[np.ndarray], index: pd.DatetimeIndex
+    ) -> dict:
+        """Risk metrics in one pass over the balance resampled to the data interval.
+
+        Ratios are computed from percent returns, so only with capital."""
+        stats = {
+            "volatility": None,
+            "sharpe": None,
+            "sortino": None,
+            "cagr": None,
+            "calmar": None,
+            "ulcer_index": None,
+            "under_water_period_max": None,
+        }
+        if balance is None or len(balance) < 2:
+            return stats
+
+        ts = index.values.astype("datetime64[s]").astype("int64")
+        interval = Interval(np.median(np.diff(ts)))
+        if interval <= 0:
+            return stats
+
+        # last balance of each interval, gaps keep the previous balance
+        bins = (ts - ts[0]) // interval
+        is_last = np.r_[bins[1:] != bins[:-1], True]
+        filled = np.searchsorted(bins[is_last], np.arange(bins[-1] + 1), side="right")
+        balance = balance[is_last][filled - 1]
+
+        equity = balance + self.capital if self.capital else balance
+        peak = np.maximum.accumulate(equity)
+        drawdown = equity - peak
+        if self.capital:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                stats.update(self._return_stats(equity, peak=peak, interval=interval))
+
+        stats["under_water_period_max"] = TimeDelta(
+            longest_run(drawdown < 0) * interval
+        )
 
-        df.at[df.index[0], position_col] = 0
-        df.at[df.index[0], quote_col] = 0
+        return stats
+
+    @staticmethod
+    def _return_stats(equity: np.ndarray, peak: np.ndarray, interval: int) -> dict:
+        """Ratios of percent returns, they need capital to be comparable."""
+        stats = {}
+        returns = np.diff(equity) / equity[:-1]
+        drawdown = (equity - peak) / peak
+
+        periods_per_year = YEAR / interval
+        mean = returns.mean()
+        std = returns.std(ddof=1) if len(returns) > 1 else 0.0
+        downside = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+
+        stats["volatility"] = _finite(std * np.sqrt(periods_per_year))
+        if std:
+            stats["sharpe"] = _finite(mean / std * np.sqrt(periods_per_year))
+        if downside:
+            stats["sortino"] = _finite(mean / downside * np.sqrt(periods_per_year))
+        if equity[-1] > 0:
+            years = (len(equity) - 1) / periods_per_year
+            cagr = (equity[-1] / equity[0]) ** (1 / years) - 1
+            stats["cagr"] = _finite(cagr)
+            if drawdown.min() < 0:
+                stats["calmar"] = _finite(cagr / -drawdown.min())
+        stats["ulcer_index"] = _finite(np.sqrt(np.mean(drawdown**2)))
+
+        return stats
 
-        wallet = Wallet()
+    def _balance_df(self, output: Output) -> pd.DataFrame:
+        balance = output.equity["balance"]
+        if self.commission:
+            balance = balance - output.ledger.fees(
+                output.df.index, commission=self.commission
+            )
 
-        for transaction in output.sessions.transactions:
-            wallet.apply(transaction, commission=self.commission)
-            ts = transaction.ts.to_datetime()
-            df.at[ts, position_col] = float(wallet.base)
-            df.at[ts, quote_col] = float(wallet.quote)
+        return pd.DataFrame(
+            {"balance": balance, "position": output.equity["position"]},
+            index=output.df.index,
+        )
 
-        df[position_col] = df[position_col].ffill()
-        df[quote_col] = df[quote_col].ffill()
 
-        _df = df[[]]
-        _df["balance"] = df[position_col] * df["close"] + df[quote_col]
-        _df["position"] = df[position_col]
+def longest_run(flags: np.ndarray) -> int:
+    """Longest streak of true values."""
+    edges = np.diff(np.r_[0, flags.astype(np.int8), 0])
+    lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+    return int(lengths.max()) if len(lengths) else 0
 
-        df.drop([position_col, quote_col], axis=1, inplace=True)
 
-        return _df
+def _finite(value) -> Optional[float]:
+    value = float(value)
+    return value if math.isfinite(value) else None
@@ -0,0 +1,102 @@
+from operator import attrgetter
+
+import numpy as np
+
+from cipher.models import Output, Stats, TimeDelta
+from .stats import StatsFactory, longest_run
+
+
+class VectorStatsFactory(StatsFactory):
+    """Same stats as StatsFactory, computed from the ledger arrays.
+
+    Used for sweeps and walk-forward windows. Amounts are summed as floats,
+    so they can differ from StatsFactory in the last digits."""
+
+    def from_output(self, output: Output) -> Stats:
+        start_ts, stop_ts = self._bounds(output)
+        period = stop_ts - start_ts
+
+        ledger = output.ledger.filter(attrgetter("is_closed"))
+        sessions_n = len(ledger.sessions)
+
+        fees = (
+            self.commission.for_ledger(ledger)
+            if self.commission and len(ledger)
+            else np.zeros(len(ledger))
+        )
+
+        # transactions grouped by session, in time order within a session
+        order = np.argsort(ledger.session_id, kind="stable")
+        starts = np.searchsorted(ledger.session_id[order], np.arange(sessions_n))
+        stops = np.r_[starts[1:], len(order)] - 1
+
+        if sessions_n:
+            pnls = np.add.reduceat((ledger.quote - fees)[order], starts)
+            ts = ledger.ts[order]
+            periods = ts[stops] - ts[starts]
+            is_long = ledger.base[order][starts] > 0
+        else:
+            pnls = np.empty(0)
+            periods = np.empty(0, dtype=np.int64)
+            is_long = np.empty(0, dtype=bool)
+
+        is_success = pnls > 0
+        success = pnls[is_success]
+        failure = -pnls[~is_success]
+
+        return Stats(
+            start_ts=start_ts,
+            stop_ts=stop_ts,
+            period=period,
+            sessions_n=sessions_n,
+            success_n=len(success),
+            failure_n=len(failure),
+            success_pnl_med=_median(success),
+            failure_pnl_med=_median(failure),
+            success_pnl_max=float(success.max()) if len(success) else None,
+            failure_pnl_max=float(failure.max()) if len(failure) else None,
+            success_row_max=longest_run(is_success),
+            failure_row_max=longest_run(~is_success),
+            pnl=float(pnls.sum()),
+            volume=float(np.abs(ledger.base).sum()),
+            longs_n=int(is_long.sum()),
+            shorts_n=int((~is_long).sum()),
+            commission=float(fees.sum()),
+            session_period_max=TimeDelta(periods.max()) if sessions_n else None,
+            session_period_median=(
+                TimeDelta(np.median(periods)) if sessions_n else None
+            ),
+            **self._balance_stats(output=output, period=period),
+        )
+
+    def _balance_stats(self, output: Output, period: TimeDelta) -> dict:
+        if not output.sessions:
+            return super()._balance_stats(output=output, period=period)
+
+        balance = output.equity["balance"].to_numpy()
+        if self.commission:
+            balance = balance - output.ledger.fees(
+                output.df.index, commission=self.commission
+            )
+        position = output.equity["position"].to_numpy()
+        balance_drawdown_max = float(
+            abs((balance - np.maximum.accumulate(balance)).min())
+        )
+
+        return {
+            "balance_min": float(balance.min()),
+            "balance_max": float(balance.max()),
+            "balance_drawdown_max": balance_drawdown_max,
+            "romad": (
+                float(balance[-1]) / balance_drawdown_max
+                if balance_drawdown_max
+                else None
+            ),
+            "exposed_period": period
+            * (1 - np.count_nonzero(position == 0) / len(position)),
+            **self._risk_stats(balance=balance, index=output.df.index),
+        }
+
+
+def _median(values: np.ndarray):
+    return float(np.median(values)) if len(values) else None
@@ -1,13 +1,18 @@
+from .bracket_book import BracketBook
 from .commission import Commission, SimpleCommission
 from .cursor import Cursor
 from .datas import Datas
 from .interval import Interval
+from .ledger import Ledger
 from .log_level import LogLevel
 from .meta import Meta
+from .open_sessions import OpenSessions
 from .output import Output
 from .position import Position
+from .rows import Row, Rows
 from .session import Session
 from .sessions import Sessions
+from .shared_frame import SharedFrame
 from .stats import Stats
 from .template import Template
 from .time import Time
@@ -17,16 +22,22 @@ from .transactions import Transactions
 from .wallet import Wallet
 
 __all__ = (
+    "BracketBook",
     "Commission",
     "Cursor",
     "Datas",
     "Interval",
+    "Ledger",
     "LogLevel",
     "Meta",
+    "OpenSessions",
     "Output",
     "Position",
+    "Row",
+    "Rows",
     "Session",
     "Sessions",
+    "SharedFrame",
     "SimpleCommission",
     "Stats",
     "Template",
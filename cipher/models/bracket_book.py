@@ -0,0 +1,97 @@
+from decimal import Decimal
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import List, Optional, Tuple
+
+
+class BracketBook:
+    """Open sessions take profit / stop loss prices, sorted by price.
+
+    Brackets below the price (long stop loss, short take profit) are triggered
+    when a bar low falls under them, brackets above the price (long take profit,
+    short stop loss) when a bar high rises above them.
+
+    Stale entries are dropped lazily, the session has to be updated
+    on every brackets or position change."""
+
+    def __init__(self):
+        self._below = []  # (-price, version, session), highest price first
+        self._above = []  # (price, version, session), lowest price first
+        self._versions = {}
+        self._entries = {}
+        self._stale = 0
+        self._counter = count()
+
+    def update(self, session):
+        self._invalidate(session)
+
+        if not session.is_open:
+            return
+
+        version = self._versions[id(session)]
+        if session.is_long:
+            below, above = session.stop_loss, session.take_profit
+        else:
+            below, above = session.take_profit, session.stop_loss
+
+        entries = 0
+        if below:
+            heappush(self._below, (-below, version, session))
+            entries += 1
+        if above:
+            heappush(self._above, (above, version, session))
+            entries += 1
+        self._entries[id(session)] = entries
+
+    def pop_triggered(self, low, high) -> List:
+        """Remove and return sessions with brackets within the bar range."""
+        sessions = {}
+
+        while self._below and self._below[0][0] < -low:
+            _, version, session = heappop(self._below)
+            self._pop(session=session, version=version, sessions=sessions)
+        while self._above and self._above[0][0] < high:
+            _, version, session = heappop(self._above)
+            self._pop(session=session, version=version, sessions=sessions)
+
+        for session in sessions.values():
+            self._invalidate(session)
+
+        return list(sessions.values())
+
+    def bounds(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """Highest bracket below and lowest bracket above the price.
+
+        Can include stale brackets, so the bounds are not tight."""
+        return (
+            -self._below[0][0] if self._below else None,
+            self._above[0][0] if self._above else None,
+        )
+
+    def __len__(self):
+        return len(self._below) + len(self._above) - self._stale
+
+    def _pop(self, session, version, sessions: dict):
+        if self._versions.get(id(session)) == version:
+            self._entries[id(session)] -= 1
+            sessions[id(session)] = session
+        else:
+            self._stale -= 1
+
+    def _invalidate(self, session):
+        self._versions[id(session)] = next(self._counter)
+        self._stale += self._entries.pop(id(session), 0)
+
+        if self._stale > 64 and self._stale > len(self):
+            self._compact()
+
+    def _compact(self):
+        self._below = [e for e in self._below if self._is_valid(e)]
+        self._above = [e for e in self._above if self._is_valid(e)]
+        heapify(self._below)
+        heapify(self._above)
+        self._stale = 0
+
+    def _is_valid(self, entry) -> bool:
+        _, version, session = entry
+        return self._versions.get(id(session)) == version
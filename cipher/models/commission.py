@@ -1,25 +1,44 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
+import numpy as np
+
+from cipher.utils import Number, to_decimal
 from cipher.values import Percent
 from .transaction import Transaction
 
+if TYPE_CHECKING:
+    from .ledger import Ledger
+
 
 class Commission(ABC):
     @abstractmethod
-    def for_transaction(self, transaction: Transaction) -> Decimal:
+    def for_transaction(self, transaction: Transaction) -> Number:
         pass
 
+    def for_ledger(self, ledger: "Ledger") -> np.ndarray:
+        """Commission of each ledger transaction, as floats."""
+        return np.fromiter(
+            (self.for_transaction(t) for t in ledger.transactions),
+            dtype=np.float64,
+            count=len(ledger),
+        )
+
 
 class SimpleCommission(Commission):
     def __init__(self, value: Union[Decimal, str, Percent]):
         if isinstance(value, Percent):
-            self.value = value.value / Decimal(100)
+            self.value = to_decimal(value.value) / Decimal(100)
         elif isinstance(value, Decimal):
             self.value = value
         else:
             self.value = Decimal(value)
 
-    def for_transaction(self, transaction: Transaction) -> Decimal:
+    def for_transaction(self, transaction: Transaction) -> Number:
+        if isinstance(transaction.quote, float):
+            return abs(transaction.quote) * float(self.value)
         return abs(transaction.quote) * self.value
+
+    def for_ledger(self, ledger: "Ledger") -> np.ndarray:
+        return np.abs(ledger.quote) * float(self.value)
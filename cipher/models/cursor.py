@@ -1,29 +1,27 @@
 from contextlib import contextmanager
 from datetime import datetime
 from decimal import Decimal
-from typing import Union
+from typing import Optional, Union
 
-from pydantic import BaseModel
-
-from cipher.utils import float_to_decimal
+from cipher.utils import Number, Slotted, get_numeric, price_to_number
 from .time import Time
 
 
-class Cursor(BaseModel):
+class Cursor(Slotted):
     """Current backtest position storage."""
 
-    price: Decimal = Decimal(0)
-    ts: Time = Time(0)
+    __slots__ = ("price", "ts")
 
-    class Config:
-        arbitrary_types_allowed = True
+    def __init__(self, price: Optional[Number] = None, ts: Time = Time(0)):
+        self.price = get_numeric().zero if price is None else price
+        self.ts = ts
 
-    def set(self, ts: datetime, price: Union[int, float, Decimal]):
-        self.ts = Time.from_datetime(ts)
-        self.price = float_to_decimal(price)
+    def set(self, ts: Union[datetime, Time], price: Union[int, float, Decimal]):
+        self.ts = ts if isinstance(ts, Time) else Time.from_datetime(ts)
+        self.price = price_to_number(price)
 
     @contextmanager
-    def patch_price(self, price: Decimal):
+    def patch_price(self, price: Number):
         _saved_price = self.price
         self.price = price
         try:
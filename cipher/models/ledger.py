@@ -0,0 +1,193 @@
+from typing import Callable, Iterable, List, Optional
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex
+
+from .commission import Commission
+from .session import Session
+from .transaction import Transaction
+
+CAPACITY = 1024
+COLUMNS = ("_ts", "_base", "_quote", "_session_id")
+
+
+class Ledger:
+    """Transactions of all sessions in time order, stored column-wise.
+
+    The trader appends transactions as they happen, so the arrays are already
+    sorted by time. Session ids are positions in the sessions list."""
+
+    def __init__(self):
+        self.sessions: List[Session] = []
+        self.transactions: List[Transaction] = []
+        self._size = 0
+        self._ts = np.empty(CAPACITY, dtype=np.int64)
+        self._base = np.empty(CAPACITY, dtype=np.float64)
+        self._quote = np.empty(CAPACITY, dtype=np.float64)
+        self._session_id = np.empty(CAPACITY, dtype=np.int64)
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[Session]) -> "Ledger":
+        """Ledger for sessions built without one, transactions are merged by time."""
+        sessions = list(sessions)
+        transactions = [t for session in sessions for t in session.transactions]
+        session_id = np.repeat(
+            np.arange(len(sessions), dtype=np.int64),
+            [len(session.transactions) for session in sessions],
+        )
+        ts = np.fromiter((t.ts for t in transactions), dtype=np.int64)
+        # stable, so transactions with the same time keep the session order
+        order = np.argsort(ts, kind="stable")
+
+        ledger = cls()
+        ledger.sessions = sessions
+        ledger._extend([transactions[i] for i in order.tolist()], session_id[order])
+        return ledger
+
+    @classmethod
+    def concat(cls, ledgers: Iterable["Ledger"]) -> "Ledger":
+        """Ledgers following each other in time."""
+        ledger = cls()
+        for other in ledgers:
+            offset = len(ledger.sessions)
+            ledger.sessions.extend(other.sessions)
+            ledger._extend(
+                other.transactions,
+                other.session_id + offset,
+                ts=other.ts,
+                base=other.base,
+                quote=other.quote,
+            )
+        return ledger
+
+    def add_session(self, session: Session) -> int:
+        self.sessions.append(session)
+        return len(self.sessions) - 1
+
+    def append(self, transaction: Transaction, session_id: int):
+        if self._size == len(self._ts):
+            self._grow(self._size + 1)
+        i = self._size
+        self._ts[i] = transaction.ts
+        self._base[i] = transaction.base
+        self._quote[i] = transaction.quote
+        self._session_id[i] = session_id
+        self.transactions.append(transaction)
+        self._size += 1
+
+    @property
+    def ts(self) -> np.ndarray:
+        return self._ts[: self._size]
+
+    @property
+    def base(self) -> np.ndarray:
+        return self._base[: self._size]
+
+    @property
+    def quote(self) -> np.ndarray:
+        return self._quote[: self._size]
+
+    @property
+    def session_id(self) -> np.ndarray:
+        return self._session_id[: self._size]
+
+    def for_session(self, session_id: int) -> np.ndarray:
+        """Positions of the session transactions."""
+        return np.flatnonzero(self.session_id == session_id)
+
+    def filter(self, condition: Callable[[Session], bool]) -> "Ledger":
+        """Ledger of the sessions matching the condition, ids are renumbered."""
+        ledger = self.__class__()
+        ids = np.full(len(self.sessions), -1, dtype=np.int64)
+        for session_id, session in enumerate(self.sessions):
+            if condition(session):
+                ids[session_id] = ledger.add_session(session)
+
+        new_ids = ids[self.session_id]
+        kept = np.flatnonzero(new_ids >= 0)
+        ledger._extend(
+            [self.transactions[i] for i in kept.tolist()],
+            new_ids[kept],
+            ts=self.ts[kept],
+            base=self.base[kept],
+            quote=self.quote[kept],
+        )
+        return ledger
+
+    def equity(self, index: DatetimeIndex, close: np.ndarray) -> DataFrame:
+        """Position, quote and mark-to-market balance at each bar of the index."""
+        position = self._at_bars(index, np.cumsum(self.base))
+        quote = self._at_bars(index, np.cumsum(self.quote))
+
+        return DataFrame(
+            {"position": position, "quote": quote, "balance": position * close + quote},
+            index=index,
+        )
+
+    def fees(self, index: DatetimeIndex, commission: Commission) -> np.ndarray:
+        """Cumulative commission at each bar of the index."""
+        return self._at_bars(index, np.cumsum(commission.for_ledger(self)))
+
+    def to_df(self) -> DataFrame:
+        """A row for each transaction of all sessions, in time order."""
+        return DataFrame(
+            {
+                "ts": self.ts.astype("datetime64[s]"),
+                "session_id": self.session_id,
+                "base": self.base,
+                "quote": self.quote,
+                "price": np.abs(self.quote / self.base),
+            }
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in COLUMNS:
+            state[name] = state[name][: self._size].copy()
+        return state
+
+    def _extend(
+        self,
+        transactions: List[Transaction],
+        session_id: np.ndarray,
+        ts: Optional[np.ndarray] = None,
+        base: Optional[np.ndarray] = None,
+        quote: Optional[np.ndarray] = None,
+    ):
+        if ts is None:
+            ts = np.fromiter((t.ts for t in transactions), dtype=np.int64)
+            base = np.fromiter((t.base for t in transactions), dtype=np.float64)
+            quote = np.fromiter((t.quote for t in transactions), dtype=np.float64)
+
+        start = self._size
+        stop = start + len(transactions)
+        if stop > len(self._ts):
+            self._grow(stop)
+        self._ts[start:stop] = ts
+        self._base[start:stop] = base
+        self._quote[start:stop] = quote
+        self._session_id[start:stop] = session_id
+        self.transactions.extend(transactions)
+        self._size = stop
+
+    def _at_bars(self, index: DatetimeIndex, cumulative: np.ndarray) -> np.ndarray:
+        # the last transaction of a bar sets the bar value
+        counts = np.searchsorted(
+            self.ts,
+            index.values.astype("datetime64[s]").astype("int64"),
+            side="right",
+        )
+        return np.r_[0.0, cumulative][counts]
+
+    def _grow(self, size: int):
+        capacity = max(len(self._ts), CAPACITY)
+        while capacity < size:
+            capacity *= 2
+        for name in COLUMNS:
+            array = getattr(self, name)
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[: self._size] = array[: self._size]
+            setattr(self, name, grown)
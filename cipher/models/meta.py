@@ -1,8 +1,13 @@
-from pydantic import BaseModel, Field
+from typing import Optional
 
+from cipher.utils import Slotted
 
-class Meta(BaseModel):
-    meta_dict: dict = Field(default_factory=dict)
+
+class Meta(Slotted):
+    __slots__ = ("meta_dict",)
+
+    def __init__(self, meta_dict: Optional[dict] = None):
+        self.meta_dict = {} if meta_dict is None else meta_dict
 
     def __getitem__(self, key):
         return self.meta_dict[key]
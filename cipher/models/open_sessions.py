@@ -0,0 +1,44 @@
+class OpenSessions:
+    """Open sessions index, updated when a session position changes.
+
+    Iteration order is the order sessions were added in."""
+
+    def __init__(self):
+        self._numbers = {}
+        self._sessions = {}
+        self._ordered = []
+
+    def add(self, session):
+        self._numbers[id(session)] = len(self._numbers)
+        self.update(session)
+
+    def update(self, session):
+        number = self._numbers.get(id(session))
+        if number is None:
+            return
+
+        if session.is_open:
+            if number not in self._sessions:
+                self._sessions[number] = session
+                self._ordered = None
+        elif number in self._sessions:
+            del self._sessions[number]
+            self._ordered = None
+
+    def sort(self, sessions) -> list:
+        """Open sessions from the given ones, in the index order."""
+        return sorted(
+            (s for s in sessions if id(s) in self._numbers and s.is_open),
+            key=lambda s: self._numbers[id(s)],
+        )
+
+    def to_list(self) -> list:
+        if self._ordered is None:
+            self._ordered = [self._sessions[n] for n in sorted(self._sessions)]
+        return self._ordered
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __len__(self):
+        return len(self._sessions)
@@ -1,8 +1,11 @@
 from typing import List, Optional
 
+import numpy as np
 from pandas import DataFrame
 from pydantic import BaseModel
 
+from cipher.utils import Numeric, get_numeric
+from .ledger import Ledger
 from .sessions import Sessions
 
 
@@ -12,6 +15,22 @@ class Output(BaseModel):
     signals: List[str]
     title: str
     description: Optional[str] = None
+    # built from the sessions when the trader does not provide them
+    ledger: Optional[Ledger] = None
+    # position, quote and balance for each bar, without commission
+    equity: Optional[DataFrame] = None
+    # numbers type of the sessions, the current numeric when not provided
+    numeric: Optional[Numeric] = None
 
     class Config:
         arbitrary_types_allowed = True
+
+    def model_post_init(self, __context):
+        if self.numeric is None:
+            self.numeric = get_numeric()
+        if self.ledger is None:
+            self.ledger = Ledger.from_sessions(self.sessions)
+        if self.equity is None:
+            self.equity = self.ledger.equity(
+                self.df.index, close=self.df["close"].to_numpy(dtype=np.float64)
+            )
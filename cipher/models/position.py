@@ -1,7 +1,7 @@
 from decimal import Decimal
-from typing import Union
+from typing import Callable, Optional, Union
 
-from cipher.utils import to_decimal
+from cipher.utils import Number, get_numeric, to_number
 from cipher.values import Base, Percent, Quote
 from .cursor import Cursor
 from .transaction import Transaction
@@ -10,11 +10,20 @@ from .wallet import Wallet
 
 
 class Position:
-    def __init__(self, cursor: Cursor, transactions: Transactions, wallet: Wallet):
+    def __init__(
+        self,
+        cursor: Cursor,
+        transactions: Transactions,
+        wallet: Wallet,
+        on_change: Optional[Callable[[], None]] = None,
+        on_transaction: Optional[Callable[[Transaction], None]] = None,
+    ):
         self._cursor = cursor
         self._transactions = transactions
         self._wallet = wallet
-        self.value = Decimal(0)
+        self._on_change = on_change
+        self._on_transaction = on_transaction
+        self.value = get_numeric().zero
 
     def __iadd__(self, other: Union[Base, Quote, Percent, Decimal, int, str, float]):
         to_add = self._parse_quantity(other)
@@ -32,7 +41,7 @@ class Position:
         new_value = self._parse_quantity(value)
         self._add(new_value - self.value)
 
-    def _add(self, to_add: Decimal):
+    def _add(self, to_add: Number):
         if to_add:
             self.value += to_add
             transaction = Transaction(
@@ -42,14 +51,18 @@ class Position:
             )
             self._transactions.append(transaction)
             self._wallet.apply(transaction)
+            if self._on_transaction:
+                self._on_transaction(transaction)
+            if self._on_change:
+                self._on_change()
         return self
 
-    def _parse_quantity(self, quantity) -> Decimal:
+    def _parse_quantity(self, quantity) -> Number:
         if isinstance(quantity, Base):
-            return quantity.value
+            return to_number(quantity.value)
         elif isinstance(quantity, Quote):
-            return quantity.value / self._cursor.price
+            return to_number(quantity.value) / self._cursor.price
         elif isinstance(quantity, Percent):
-            return quantity.value / Decimal(100) * self.value
+            return to_number(quantity.value) / 100 * self.value
         else:
-            return to_decimal(quantity)
+            return to_number(quantity)
@@ -0,0 +1,61 @@
+from collections.abc import Mapping
+
+import numpy as np
+from pandas import DataFrame
+
+
+class Row(Mapping):
+    """Read-only dict-like view of a dataframe row.
+
+    Values are read from the column arrays only when accessed."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: dict, index: int):
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._columns[key][self._index]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class Rows:
+    """Dataframe columns extracted into numpy arrays once."""
+
+    def __init__(self, df: DataFrame):
+        self.index = df.index
+        self.columns = {
+            column: self._to_array(df.iloc[:, n]) for n, column in enumerate(df.columns)
+        }
+        self._length = len(df)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int) -> Row:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Row index out of range.")
+        return Row(self.columns, index)
+
+    def __iter__(self):
+        columns = self.columns
+        for index in range(self._length):
+            yield Row(columns, index)
+
+    @staticmethod
+    def _to_array(series) -> np.ndarray:
+        if isinstance(series.dtype, np.dtype):
+            return series.to_numpy()
+        # extension dtypes (nullable boolean, Int64, ...) keep pd.NA for nulls
+        return series.to_numpy(dtype=object)
@@ -1,26 +1,33 @@
-from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field
-
+from cipher.utils import Number, Slotted
 from .meta import Meta
 from .time import Time
 from .transactions import Transactions
 
 
-class Session(BaseModel):
-    transactions: Transactions = Field(default_factory=Transactions)
-    take_profit: Optional[Decimal] = None
-    stop_loss: Optional[Decimal] = None
-    meta: Meta = Field(default_factory=Meta)
+class Session(Slotted):
+    __slots__ = ("transactions", "take_profit", "stop_loss", "meta")
+
+    def __init__(
+        self,
+        transactions: Optional[Transactions] = None,
+        take_profit: Optional[Number] = None,
+        stop_loss: Optional[Number] = None,
+        meta: Optional[Meta] = None,
+    ):
+        self.transactions = Transactions() if transactions is None else transactions
+        self.take_profit = take_profit
+        self.stop_loss = stop_loss
+        self.meta = Meta() if meta is None else meta
 
     @property
-    def base(self):
-        return sum(t.base for t in self.transactions)
+    def base(self) -> Number:
+        return self.transactions.base
 
     @property
-    def quote(self) -> Decimal:
-        return Decimal(sum(t.quote for t in self.transactions))
+    def quote(self) -> Number:
+        return self.transactions.quote
 
     @property
     def is_long(self) -> bool:
@@ -28,7 +35,7 @@ class Session(BaseModel):
 
     @property
     def is_open(self) -> bool:
-        return self.base != 0
+        return self.transactions.base != 0
 
     @property
     def is_closed(self) -> bool:
@@ -43,6 +50,3 @@ class Session(BaseModel):
         if self.is_open:
             return None
         return self.transactions[-1].ts
-
-    class Config:
-        arbitrary_types_allowed = True
@@ -1,12 +1,18 @@
-from functools import reduce
+from itertools import chain
 from operator import attrgetter
 from typing import List
 
+import numpy as np
+from pandas import Categorical, DataFrame
 from tabulate import tabulate
 from typing_extensions import Self
 
+from .ledger import Ledger
+from .time import Time
+from .time_delta import TimeDelta
 from .transaction import Transaction
-from .wallet import Wallet
+
+TABLE_ROWS = 10
 
 
 class Sessions(list):
@@ -28,32 +34,95 @@ class Sessions(list):
     @property
     def transactions(self) -> List[Transaction]:
         """Sorted chained transactions from closed sessions."""
-        return list(
-            sorted(
-                reduce(
-                    lambda a, b: a + b,
-                    map(attrgetter("transactions"), self.closed_sessions),
-                    [],
-                ),
-                key=attrgetter("ts"),
+        return sorted(
+            chain.from_iterable(map(attrgetter("transactions"), self.closed_sessions)),
+            key=attrgetter("ts"),
+        )
+
+    def to_df(self) -> DataFrame:
+        """A row for each session, amounts are floats.
+
+        Entry and exit prices are averages weighted by base,
+        pnl is net of commission and empty for open sessions."""
+        ledger = Ledger.from_sessions(self)
+        n = len(self)
+        session_id = ledger.session_id
+        base = ledger.base
+        fees = (
+            self._commission.for_ledger(ledger)
+            if self._commission and len(ledger)
+            else np.zeros(len(ledger))
+        )
+
+        # ledger positions of the first and the last transaction of each session,
+        # -1 points to a zero at the end for sessions without transactions
+        ids, positions = np.unique(session_id, return_index=True)
+        first = np.full(n, -1)
+        first[ids] = positions
+        ids, positions = np.unique(session_id[::-1], return_index=True)
+        last = np.full(n, -1)
+        last[ids] = len(ledger) - 1 - positions
+        ts = np.r_[ledger.ts, 0]
+
+        has_transactions = first >= 0
+        is_closed = np.fromiter((s.is_closed for s in self), dtype=bool, count=n)
+        is_closed &= has_transactions
+        is_long = np.r_[base, 1.0][first] > 0
+        is_entry = (base > 0) == is_long[session_id]
+
+        def by_session(values: np.ndarray) -> np.ndarray:
+            return np.bincount(session_id, weights=values, minlength=n)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            entry_price = -by_session(np.where(is_entry, ledger.quote, 0.0)) / (
+                by_session(np.where(is_entry, base, 0.0))
+            )
+            exit_price = -by_session(np.where(is_entry, 0.0, ledger.quote)) / (
+                by_session(np.where(is_entry, 0.0, base))
             )
+
+        opened_ts = ts[first].astype("datetime64[s]")
+        closed_ts = ts[last].astype("datetime64[s]")
+        opened_ts[~has_transactions] = np.datetime64("NaT")
+        closed_ts[~is_closed] = np.datetime64("NaT")
+        session_fees = by_session(fees)
+
+        df = DataFrame(
+            {
+                "side": Categorical(
+                    np.where(is_long, "long", "short"), categories=["long", "short"]
+                ),
+                "opened_ts": opened_ts,
+                "closed_ts": closed_ts,
+                "duration": closed_ts - opened_ts,
+                "entry_price": entry_price,
+                "exit_price": exit_price,
+                "volume": by_session(np.abs(base)),
+                "fees": session_fees,
+                "pnl": np.where(
+                    is_closed, by_session(ledger.quote) - session_fees, np.nan
+                ),
+            }
         )
 
+        meta_df = DataFrame([s.meta.to_dict() for s in self], index=df.index)
+        return df.join(meta_df.add_prefix("meta_"))
+
     def to_table(self):
-        rows = []
-
-        for session in self.closed_sessions:
-            wallet = Wallet()
-            for transaction in session.transactions:
-                wallet.apply(transaction, commission=self._commission)
-
-            rows.append(
-                [
-                    f"{'long' if session.is_long else 'short'} {session.opened_ts}",
-                    str(session.closed_ts - session.opened_ts),
-                    str(wallet.quote),
-                ]
+        """First and last closed sessions."""
+        df = self.to_df()
+        df = df[df["closed_ts"].notna()]
+
+        opened_ts = df["opened_ts"].to_numpy().astype("datetime64[s]").astype("int64")
+        duration = df["duration"].to_numpy().astype("timedelta64[s]").astype("int64")
+        rows = [
+            [f"{side} {Time(ts)}", str(TimeDelta(period)), str(pnl)]
+            for side, ts, period, pnl in zip(
+                df["side"], opened_ts.tolist(), duration.tolist(), df["pnl"]
             )
+        ]
+        if len(rows) > 2 * TABLE_ROWS:
+            rows = rows[:TABLE_ROWS] + [["...", "", ""]] + rows[-TABLE_ROWS:]
 
         return tabulate(rows, headers=["Session", "Period", "PnL"])
 
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import weakref
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame, Index
+
+# numpy dtype kinds that can be stored as raw bytes: bool, int, uint, float, datetime
+SHARED_KINDS = "biufmM"
+ALIGNMENT = 64
+
+
+class SharedFrame:
+    """Dataframe index and columns published once into a memory-mapped file.
+
+    Only the file path and the layout are pickled, so worker processes
+    map the data instead of receiving a copy. Mappings are copy-on-write,
+    pages are shared until a strategy modifies them.
+    The file is removed when the publishing instance is closed or collected."""
+
+    def __init__(self, df: DataFrame, root: Optional[str] = None):
+        index = df.index.to_numpy()
+        self._check_dtype(index.dtype, name="index")
+
+        groups = {}
+        for n, column in enumerate(df.columns):
+            dtype = df.dtypes.iloc[n]
+            self._check_dtype(dtype, name=column)
+            groups.setdefault(dtype.str, []).append(column)
+
+        self.length = len(df)
+        self.columns = list(df.columns)
+        self.index_name = df.index.name
+        self.index_dtype = index.dtype.str
+        self.blocks: List[Tuple[str, list, int]] = []
+
+        size = self._align(index.nbytes)
+        for dtype, columns in groups.items():
+            self.blocks.append((dtype, columns, size))
+            size += self._align(np.dtype(dtype).itemsize * len(columns) * self.length)
+        # zero size files can not be mapped
+        self.size = max(size, 1)
+
+        fd, self.path = tempfile.mkstemp(
+            prefix="cipher_", suffix=".frame", dir=root or self._default_root()
+        )
+        os.close(fd)
+        self._finalizer = weakref.finalize(self, _remove, self.path)
+
+        buffer = np.memmap(self.path, dtype=np.uint8, mode="w+", shape=(self.size,))
+        shared_index = self._view(
+            buffer, offset=0, dtype=self.index_dtype, shape=(self.length,)
+        )
+        shared_index[:] = index
+        for dtype, columns, offset in self.blocks:
+            block = self._view(
+                buffer, offset=offset, dtype=dtype, shape=(len(columns), self.length)
+            )
+            for n, column in enumerate(columns):
+                block[n] = df[column].to_numpy()
+        buffer.flush()
+        del buffer
+
+    def to_df(self) -> DataFrame:
+        """New dataframe on top of the shared arrays, without copying."""
+        # private mapping, changes are not visible to other dataframes
+        buffer = np.memmap(self.path, dtype=np.uint8, mode="c", shape=(self.size,))
+
+        index = Index(
+            self._view(buffer, offset=0, dtype=self.index_dtype, shape=(self.length,)),
+            name=self.index_name,
+            copy=False,
+        )
+        if not self.blocks:
+            return DataFrame(index=index)
+
+        # one view per column, a frame built from blocks would be copied
+        # by the column take on pandas without copy-on-write
+        views = {}
+        for dtype, columns, offset in self.blocks:
+            block = self._view(
+                buffer,
+                offset=offset,
+                dtype=dtype,
+                shape=(len(columns), self.length),
+            )
+            for n, column in enumerate(columns):
+                views[column] = block[n]
+
+        return DataFrame(
+            {column: views[column] for column in self.columns},
+            index=index,
+            copy=False,
+        )
+
+    def close(self):
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the file belongs to the publishing process
+        state["_finalizer"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._finalizer = lambda: None
+
+    @staticmethod
+    def _view(buffer, offset: int, dtype: str, shape: tuple) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        nbytes = dtype.itemsize * int(np.prod(shape))
+        return (
+            buffer[offset : offset + nbytes].view(np.ndarray).view(dtype).reshape(shape)
+        )
+
+    @staticmethod
+    def _align(size: int) -> int:
+        return -(-size // ALIGNMENT) * ALIGNMENT
+
+    @staticmethod
+    def _check_dtype(dtype, name):
+        if not isinstance(dtype, np.dtype) or dtype.kind not in SHARED_KINDS:
+            raise ValueError(f"Can not share {name} of {dtype} type.")
+
+    @staticmethod
+    def _default_root() -> Optional[str]:
+        # tmpfs keeps the pages in memory
+        return "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -4,6 +4,7 @@ from typing import Optional
 from pydantic import BaseModel
 from tabulate import tabulate
 
+from cipher.utils import Number
 from .time import Time
 from .time_delta import TimeDelta
 
@@ -27,21 +28,45 @@ class Stats(BaseModel):
     session_period_max: Optional[TimeDelta]
 
     # performance
-    pnl: Decimal  # profit and loss
-    volume: Decimal
-    commission: Decimal
-    success_pnl_med: Optional[Decimal]
-    failure_pnl_med: Optional[Decimal]
-    success_pnl_max: Optional[Decimal]
-    failure_pnl_max: Optional[Decimal]
+    pnl: Number  # profit and loss
+    volume: Number
+    commission: Number
+    success_pnl_med: Optional[Number]
+    failure_pnl_med: Optional[Number]
+    success_pnl_max: Optional[Number]
+    failure_pnl_max: Optional[Number]
     success_row_max: int
     failure_row_max: int
-    balance_min: Decimal
-    balance_max: Decimal
-    balance_drawdown_max: Decimal
-    romad: Optional[Decimal]
+    balance_min: Number
+    balance_max: Number
+    balance_drawdown_max: Number
+    romad: Optional[Number]
+
+    # risk, annualized from returns over the data interval,
+    # returns are relative to capital, None without it
+    volatility: Optional[Number] = None
+    sharpe: Optional[Number] = None
+    sortino: Optional[Number] = None
+    cagr: Optional[Number] = None
+    calmar: Optional[Number] = None
+    ulcer_index: Optional[Number] = None
+    under_water_period_max: Optional[TimeDelta] = None  # set without capital too
 
     def to_table(self):
+        risk_rows = [
+            ["volatility", self.volatility, ""],
+            ["sharpe", self.sharpe, ""],
+            ["sortino", self.sortino, ""],
+            [
+                "cagr",
+                self.cagr,
+                self._to_percent(self.cagr, 1) if self.cagr is not None else "",
+            ],
+            ["calmar", self.calmar, ""],
+            ["ulcer index", self.ulcer_index, ""],
+            ["under water max", self.under_water_period_max, ""],
+        ]
+
         return tabulate(
             [
                 ["start", str(self.start_ts), ""],
@@ -85,7 +110,11 @@ class Stats(BaseModel):
                 ["volume", str(self.volume), ""],
                 [
                     "commission",
-                    str(self.commission.normalize()),
+                    str(
+                        self.commission.normalize()
+                        if isinstance(self.commission, Decimal)
+                        else self.commission
+                    ),
                     (
                         self._to_percent(self.commission, self.pnl)
                         if self.pnl > self.commission
@@ -101,6 +130,12 @@ class Stats(BaseModel):
                 ["balance max", str(self.balance_max), ""],
                 ["balance drawdown", str(self.balance_drawdown_max), ""],
                 ["romad", str(self.romad), ""],
+            ]
+            # risk stats that were not computed are omitted
+            + [
+                [name, str(value), percent]
+                for name, value, percent in risk_rows
+                if value is not None
             ],
         )
 
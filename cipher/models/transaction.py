@@ -1,19 +1,26 @@
-from decimal import Decimal
+from cipher.utils import Number, Slotted
+from .time import Time
 
-from pydantic import BaseModel
+_set = object.__setattr__
 
-from .time import Time
 
+class Transaction(Slotted):
+    __slots__ = ("ts", "base", "quote")
 
-class Transaction(BaseModel):
-    ts: Time
-    base: Decimal
-    quote: Decimal
+    def __init__(self, ts: Time, base: Number, quote: Number):
+        _set(self, "ts", ts)
+        _set(self, "base", base)
+        _set(self, "quote", quote)
 
     @property
-    def price(self) -> Decimal:
+    def price(self) -> Number:
         return abs(self.quote / self.base)
 
-    class Config:
-        frozen = True
-        arbitrary_types_allowed = True
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __hash__(self):
+        return hash((self.ts, self.base, self.quote))
+
+    def __reduce__(self):
+        return self.__class__, (self.ts, self.base, self.quote)
@@ -1,2 +1,83 @@
+from typing import Iterable
+
+import numpy as np
+from pandas import DataFrame
+
+from cipher.utils import get_numeric
+from .transaction import Transaction
+
+
 class Transactions(list):
-    pass
+    """Transactions list with running base and quote totals.
+
+    Totals are updated on append, so sessions read them without summing
+    the whole list. Other modifications recount them."""
+
+    __slots__ = ("base", "quote")
+
+    def __init__(self, transactions: Iterable[Transaction] = ()):
+        super().__init__(transactions)
+        self._recount()
+
+    def append(self, transaction: Transaction):
+        super().append(transaction)
+        self.base += transaction.base
+        self.quote += transaction.quote
+
+    def extend(self, transactions: Iterable[Transaction]):
+        for transaction in transactions:
+            self.append(transaction)
+
+    def __iadd__(self, transactions: Iterable[Transaction]):
+        self.extend(transactions)
+        return self
+
+    def insert(self, index, transaction: Transaction):
+        super().insert(index, transaction)
+        self._recount()
+
+    def pop(self, index=-1) -> Transaction:
+        transaction = super().pop(index)
+        self._recount()
+        return transaction
+
+    def remove(self, transaction: Transaction):
+        super().remove(transaction)
+        self._recount()
+
+    def clear(self):
+        super().clear()
+        self._recount()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._recount()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._recount()
+
+    def to_df(self) -> DataFrame:
+        """A row for each transaction, amounts are floats."""
+        n = len(self)
+        ts = np.fromiter((t.ts for t in self), dtype=np.int64, count=n)
+        base = np.fromiter((t.base for t in self), dtype=np.float64, count=n)
+        quote = np.fromiter((t.quote for t in self), dtype=np.float64, count=n)
+
+        return DataFrame(
+            {
+                "ts": ts.astype("datetime64[s]"),
+                "base": base,
+                "quote": quote,
+                "price": np.abs(quote / base),
+            }
+        )
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def _recount(self):
+        # the totals keep the number type of the transactions
+        zero = self[0].base * 0 if self else get_numeric().zero
+        self.base = sum((t.base for t in self), zero)
+        self.quote = sum((t.quote for t in self), zero)
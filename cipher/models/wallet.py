@@ -1,14 +1,14 @@
-from decimal import Decimal
 from typing import Optional
 
+from cipher.utils import Number, get_numeric
 from .commission import Commission
 from .transaction import Transaction
 
 
 class Wallet:
     def __init__(self):
-        self._base = Decimal(0)
-        self._quote = Decimal(0)
+        self._base = get_numeric().zero
+        self._quote = get_numeric().zero
 
     def apply(self, transaction: Transaction, commission: Optional[Commission] = None):
         self._base += transaction.base
@@ -18,9 +18,9 @@ class Wallet:
             self._quote -= commission.for_transaction(transaction)
 
     @property
-    def base(self) -> Decimal:
+    def base(self) -> Number:
         return self._base
 
     @property
-    def quote(self) -> Decimal:
+    def quote(self) -> Number:
         return self._quote
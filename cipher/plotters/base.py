@@ -6,7 +6,7 @@ from typing import List, Optional, Union
 import numpy as np
 import pandas as pd
 
-from ..models import Commission, Output, Time, Wallet
+from ..models import Commission, Output, Time
 
 logger = logging.getLogger(__name__)
 
@@ -62,12 +62,16 @@ class Plotter(ABC):
         self.signals = output.signals
         self.sessions = output.sessions.closed_sessions
 
-        extras_df = output.df[[]]
-        extras_df["base"] = self._build_asset_series(asset_name="base")
-        extras_df["quote"] = self._build_asset_series(asset_name="quote")
-        extras_df["balance"] = (
-            extras_df["base"] * output.df["close"] + extras_df["quote"]
+        fees = (
+            output.ledger.fees(output.df.index, commission=commission)
+            if commission
+            else 0.0
         )
+
+        extras_df = output.df[[]]
+        extras_df["base"] = output.equity["position"]
+        extras_df["quote"] = output.equity["quote"] - fees
+        extras_df["balance"] = output.equity["balance"] - fees
         extras_df["sessions_long_open"] = self._build_session_series(
             is_long=True, is_open=True
         )
@@ -134,29 +138,6 @@ class Plotter(ABC):
             .astype(np.float64)
         )
 
-    def _build_asset_series(self, asset_name):
-        df = self.output.df
-        column_name = f"_asset_{asset_name}"
-
-        df[column_name] = pd.Series(dtype="float64")
-        df.at[df.index[0], column_name] = 0
-
-        wallet = Wallet()
-
-        for transaction in self.sessions.transactions:
-            wallet.apply(transaction, commission=self.commission)
-            df.at[transaction.ts.to_datetime(), column_name] = float(
-                getattr(wallet, asset_name)
-            )
-
-        df[column_name] = df[column_name].ffill()
-
-        result = df[column_name]
-
-        df.drop([column_name], axis=1, inplace=True)
-
-        return result
-
     def _build_session_series(self, is_long, is_open):
         df = self.output.df
         column_name = f"_sessions_{is_long}_{is_open}"
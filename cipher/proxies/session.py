@@ -1,25 +1,56 @@
 from decimal import Decimal
-from typing import Optional, Union
-
-from cipher.models import Cursor, Position, Session, Transactions, Wallet
-from cipher.utils import to_decimal
+from typing import Callable, Optional, Union
+
+from cipher.models import (
+    Cursor,
+    Ledger,
+    Position,
+    Session,
+    Transaction,
+    Transactions,
+    Wallet,
+)
+from cipher.utils import Number, to_number
 from cipher.values import Base, Percent, Quote
 
 
 class SessionProxy:
-    def __init__(self, session: Session, cursor: Cursor, wallet: Wallet):
+    def __init__(
+        self,
+        session: Session,
+        cursor: Cursor,
+        wallet: Wallet,
+        on_change: Optional[Callable[["SessionProxy"], None]] = None,
+        ledger: Optional[Ledger] = None,
+    ):
         self._session = session
         self._cursor = cursor
+        self._on_change = on_change
+        self._ledger = ledger
+        self._session_id = None
         self._position = Position(
-            cursor=cursor, transactions=self._session.transactions, wallet=wallet
+            cursor=cursor,
+            transactions=self._session.transactions,
+            wallet=wallet,
+            on_change=self._notify if on_change else None,
+            on_transaction=self._record if ledger is not None else None,
         )
         self.meta = session.meta
 
-    def _parse_price(self, price: Union[Percent, Decimal, int, str, float]) -> Decimal:
+    def _notify(self):
+        self._on_change(self)
+
+    def _record(self, transaction: Transaction):
+        # sessions without transactions are not added to the ledger
+        if self._session_id is None:
+            self._session_id = self._ledger.add_session(self._session)
+        self._ledger.append(transaction, session_id=self._session_id)
+
+    def _parse_price(self, price: Union[Percent, Decimal, int, str, float]) -> Number:
         if isinstance(price, Percent):
-            return (price.value / Decimal(100) + Decimal(1)) * self._cursor.price
+            return (to_number(price.value) / 100 + 1) * self._cursor.price
         else:
-            return to_decimal(price)
+            return to_number(price)
 
     @property
     def session(self) -> Session:
@@ -42,7 +73,7 @@ class SessionProxy:
         return self._session.transactions
 
     @property
-    def take_profit(self) -> Optional[Decimal]:
+    def take_profit(self) -> Optional[Number]:
         return self._session.take_profit
 
     @take_profit.setter
@@ -57,9 +88,11 @@ class SessionProxy:
             assert price < self._cursor.price
 
         self._session.take_profit = price
+        if self._on_change:
+            self._notify()
 
     @property
-    def stop_loss(self) -> Optional[Decimal]:
+    def stop_loss(self) -> Optional[Number]:
         return self._session.stop_loss
 
     @stop_loss.setter
@@ -74,6 +107,8 @@ class SessionProxy:
             assert price > self._cursor.price
 
         self._session.stop_loss = price
+        if self._on_change:
+            self._notify()
 
     @property
     def position(self) -> Position:
@@ -89,8 +124,8 @@ class SessionProxy:
             self._position.set(value)
 
     def should_tp_sl(
-        self, low: Decimal, high: Decimal
-    ) -> (Optional[Decimal], Optional[Decimal]):  # take_profit, stop_loss
+        self, low: Number, high: Number
+    ) -> (Optional[Number], Optional[Number]):  # take_profit, stop_loss
         take_profit = None
         stop_loss = None
 
@@ -1,17 +1,93 @@
 import logging
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from cipher.models import Time
 from cipher.sources import Source
+from .manifest import Chunk, Manifest
 
 logger = logging.getLogger(__name__)
 
+FLOAT_COLUMNS = ("open", "high", "low", "close", "volume")
+CAPACITY = 1024
+
+
+class FrameBuilder:
+    """Collects chunk rows within a range into growing column arrays.
+
+    Chunks are appended in ts order, rows already collected are skipped,
+    so only the arrays and the current chunk are held in memory."""
+
+    def __init__(self, start_ts: Time, stop_ts: Time):
+        self.start_ts = start_ts
+        self.stop_ts = stop_ts
+        self.columns: Dict[str, np.ndarray] = {}
+        self.size = 0
+        self.last_ts = None
+
+    def append(self, chunk: Dict[str, np.ndarray]):
+        if not self.columns:
+            self.columns = {
+                name: np.empty(0, dtype=values.dtype) for name, values in chunk.items()
+            }
+
+        ts = chunk["ts"]
+        mask = (ts >= self.start_ts) & (ts < self.stop_ts)
+        if self.last_ts is not None:
+            mask &= ts > self.last_ts
+        n = int(mask.sum())
+        if not n:
+            return
+
+        self._grow(chunk, self.size + n)
+        for name, values in self.columns.items():
+            values[self.size : self.size + n] = chunk[name][mask]
+        self.size += n
+        self.last_ts = self.columns["ts"][self.size - 1]
+
+    def to_df(self) -> pd.DataFrame:
+        columns = {name: values[: self.size] for name, values in self.columns.items()}
+        ts = columns.pop("ts", np.empty(0, dtype=np.int64))
+
+        return pd.DataFrame(
+            columns, index=pd.Index(ts.astype("datetime64[s]"), name="ts")
+        )
+
+    def _grow(self, chunk: Dict[str, np.ndarray], size: int):
+        capacity = len(self.columns["ts"])
+        dtypes = {
+            name: np.result_type(values, chunk[name])
+            for name, values in self.columns.items()
+        }
+        if capacity >= size and all(
+            dtypes[name] == values.dtype for name, values in self.columns.items()
+        ):
+            return
+
+        capacity = max(capacity, CAPACITY)
+        while capacity < size:
+            capacity *= 2
+
+        for name, values in self.columns.items():
+            grown = np.empty(capacity, dtype=dtypes[name])
+            grown[: self.size] = values[: self.size]
+            self.columns[name] = grown
+
 
 class DataService:
-    def __init__(self, cache_root: Path):
+    """Loads source rows into dataframes, caching them by chunks.
+
+    Sources write csv, the service stores each chunk as npz with an int64 ts
+    column and float64 ohlcv columns. Chunks cached as csv are converted
+    on the first read."""
+
+    def __init__(self, cache_root: Path, compression: bool = False, jobs: int = 4):
         if cache_root.exists():
             assert cache_root.is_dir()
         else:
@@ -19,13 +95,101 @@ class DataService:
             cache_root.mkdir()
 
         self.cache_root = cache_root
+        self.compression = compression
+        self.jobs = jobs
+        self._manifests: Dict[str, Manifest] = {}
 
     def load_df(self, source: Source, start_ts: Time, stop_ts: Time):
-        ts = start_ts
-        paths = []
+        frame = FrameBuilder(start_ts=start_ts, stop_ts=stop_ts)
+        for path in self._iter_chunks(
+            source=source, start_ts=start_ts, stop_ts=stop_ts
+        ):
+            frame.append(self._read_chunk(path))
+
+        return frame.to_df()
+
+    def compact(self, prefix: Optional[str] = None) -> int:
+        """Merges adjacent completed chunks into monthly segments.
+
+        Chunks are grouped by the month of their first ts, a segment covers
+        the same rows as the chunks it replaces, csv chunks are converted.
+        Compacts all the cached sources if prefix is not specified.
+        Returns the number of chunks removed.
+        """
+        if prefix is None:
+            prefixes = sorted(
+                p.relative_to(self.cache_root).as_posix()
+                for p in self.cache_root.glob("*/*")
+                if p.is_dir()
+            )
+        else:
+            prefixes = [prefix]
+
+        removed = 0
+        for prefix in prefixes:
+            manifest = self._get_manifest(prefix=prefix)
+            root = self.cache_root / prefix
 
+            for chunk in manifest.chunks:
+                self._converted(prefix=prefix, chunk=chunk)
+
+            for chunks in self._compaction_groups(manifest):
+                datas = [self._read_chunk(root / c.name) for c in chunks]
+                runs = [[0]]
+                for i in range(1, len(chunks)):
+                    if self._are_adjacent(datas[i - 1], chunks[i]):
+                        runs[-1].append(i)
+                    else:
+                        runs.append([i])
+
+                for run in runs:
+                    if len(run) < 2:
+                        continue
+
+                    first_ts = min(chunks[i].first_ts for i in run)
+                    last_ts = max(chunks[i].last_ts for i in run)
+                    path = self._write_chunk(
+                        columns=self._merge_chunks([datas[i] for i in run]),
+                        path=self.cache_root
+                        / self._build_path(
+                            prefix=prefix,
+                            first_ts=first_ts,
+                            last_ts=last_ts,
+                            completed=True,
+                        ),
+                    )
+
+                    for i in run:
+                        manifest.remove(chunks[i].name)
+                    manifest.add(Chunk(first_ts, last_ts, path.name, True))
+                    manifest.save()
+
+                    # removed after the manifest points at the segment
+                    for i in run:
+                        if chunks[i].name != path.name:
+                            (root / chunks[i].name).unlink(missing_ok=True)
+                    removed += len(run) - 1
+
+            logger.info(f"Compacted {prefix}")
+
+        return removed
+
+    def _iter_chunks(
+        self, source: Source, start_ts: Time, stop_ts: Time
+    ) -> Iterator[Path]:
+        """Paths of the chunks covering the range, loads missing chunks.
+
+        Sources that are not paged are stepped through by the size
+        of the loaded chunks."""
+        if source.page_size:
+            yield from self._iter_pages(
+                source=source, start_ts=start_ts, stop_ts=stop_ts
+            )
+            return
+
+        ts = start_ts
         previous_first_ts = None
-        for i in range(20):
+        while True:
             result = self._load_from_cache(prefix=source.slug, ts=ts)
             if result:
                 first_ts, last_ts, p = result
@@ -38,86 +202,248 @@ class DataService:
                     break
                 previous_first_ts = first_ts
 
-            paths.append(p)
+            yield p
 
-            if not completed:
+            if not completed or last_ts >= stop_ts:
                 break
 
-            if last_ts >= stop_ts:
-                break
-            else:
-                ts = last_ts + (last_ts - first_ts) / 2
+            ts = last_ts + (last_ts - first_ts) / 2
 
-        df = pd.concat(
-            (pd.read_csv(p) for p in paths), ignore_index=True
-        ).drop_duplicates(subset=["ts"])
+    def _iter_pages(
+        self, source: Source, start_ts: Time, stop_ts: Time
+    ) -> Iterator[Path]:
+        """Paths of the chunks covering the range, in order.
 
-        return (
-            df[(df.ts >= start_ts) & (df.ts < stop_ts)]
-            .astype({"ts": "datetime64[s]"})
-            .set_index("ts")
-        )
+        Pages are planned lazily, a cached segment skips all the pages it
+        covers. Missing pages are fetched by a thread pool, up to jobs pages
+        ahead, the manifest is only updated from this thread. Pages fetched
+        ahead that turn out to be covered or past an incomplete page
+        are dropped."""
+        page_size = source.page_size
+        manifest = self._get_manifest(prefix=source.slug)
+
+        def next_page(ts: Time, last_ts: Time) -> Time:
+            return max(ts + page_size, last_ts.block_ts(page_size) + page_size)
+
+        ts = start_ts.block_ts(page_size)
+        ahead_ts = ts
+        futures: Dict[Time, Future] = {}
+        dropped: List[Future] = []
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            try:
+                while ts < stop_ts:
+                    # pages covered by the previous chunk
+                    for page_ts in [t for t in futures if t < ts]:
+                        future = futures.pop(page_ts)
+                        future.cancel()
+                        dropped.append(future)
+
+                    ahead_ts = max(ahead_ts, ts)
+                    while len(futures) < self.jobs and ahead_ts < stop_ts:
+                        chunk = manifest.find(ahead_ts)
+                        if chunk:
+                            ahead_ts = next_page(ahead_ts, Time(chunk.last_ts))
+                        else:
+                            futures[ahead_ts] = executor.submit(
+                                self._fetch_page, source=source, ts=ahead_ts
+                            )
+                            ahead_ts += page_size
+
+                    if ts in futures:
+                        first_ts, last_ts, p, completed = futures.pop(ts).result()
+                        self._add_chunk(
+                            prefix=source.slug,
+                            chunk=Chunk(int(first_ts), int(last_ts), p.name, completed),
+                        )
+                    else:
+                        result = self._load_from_cache(prefix=source.slug, ts=ts)
+                        if result:
+                            first_ts, last_ts, p = result
+                            completed = True
+                        else:
+                            first_ts, last_ts, p, completed = self._load_from_source(
+                                source=source, ts=ts
+                            )
+
+                    yield p
+
+                    if not completed or last_ts >= stop_ts:
+                        break
+                    ts = next_page(ts, last_ts)
+            finally:
+                for future in futures.values():
+                    future.cancel()
+                self._drop_pages(
+                    prefix=source.slug, futures=dropped + list(futures.values())
+                )
 
     def _load_from_source(self, source: Source, ts: Time) -> (Time, Time, Path, bool):
+        first_ts, last_ts, path, completed = self._fetch_page(source=source, ts=ts)
+        self._add_chunk(
+            prefix=source.slug,
+            chunk=Chunk(int(first_ts), int(last_ts), path.name, completed),
+        )
+
+        return first_ts, last_ts, path, completed
+
+    def _fetch_page(self, source: Source, ts: Time) -> (Time, Time, Path, bool):
+        """Loads a chunk from the source into the cache, without indexing it."""
         temp_path = self.cache_root / self._build_temp_path(prefix=source.slug, ts=ts)
         temp_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
             first_ts, last_ts, completed = source.load(ts=ts, path=temp_path)
-        except Exception:
+            path = self._convert_chunk(
+                csv_path=temp_path,
+                path=self.cache_root
+                / self._build_path(
+                    prefix=source.slug,
+                    first_ts=first_ts,
+                    last_ts=last_ts,
+                    completed=completed,
+                ),
+            )
+        finally:
             if temp_path.exists():
                 temp_path.unlink()
-            raise
 
-        if completed:
+        logger.info(f"Loaded from {source.slug} {first_ts}..{last_ts}")
+
+        return first_ts, last_ts, path, completed
+
+    def _add_chunk(self, prefix: str, chunk: Chunk):
+        if chunk.completed:
             incomplete_path = self.cache_root / self._build_path(
-                prefix=source.slug,
-                first_ts=first_ts,
-                last_ts=last_ts,
+                prefix=prefix,
+                first_ts=chunk.first_ts,
+                last_ts=chunk.last_ts,
                 completed=False,
             )
-            if incomplete_path.exists():
-                incomplete_path.unlink()
+            for p in (incomplete_path, incomplete_path.with_suffix(".csv")):
+                if p.exists():
+                    p.unlink()
 
-        logger.info(f"Loaded from {source.slug} {first_ts}..{last_ts}")
+        manifest = self._get_manifest(prefix=prefix)
+        manifest.add(chunk)
+        manifest.save()
 
-        return (
-            first_ts,
-            last_ts,
-            temp_path.rename(
-                self.cache_root
-                / self._build_path(
-                    prefix=source.slug,
-                    first_ts=first_ts,
-                    last_ts=last_ts,
-                    completed=completed,
+    def _drop_pages(self, prefix: str, futures: Iterable[Future]):
+        """Indexes completed pages that were fetched ahead, removes the rest."""
+        manifest = self._get_manifest(prefix=prefix)
+        for future in futures:
+            if future.cancelled() or future.exception():
+                continue
+
+            first_ts, last_ts, p, completed = future.result()
+            if completed:
+                self._add_chunk(
+                    prefix=prefix,
+                    chunk=Chunk(int(first_ts), int(last_ts), p.name, completed),
                 )
-            ),
-            completed,
-        )
+            elif not any(c.name == p.name for c in manifest.chunks):
+                p.unlink(missing_ok=True)
 
     def _load_from_cache(
         self, prefix: str, ts: Time
     ) -> Optional[Tuple[Time, Time, Path]]:
-        second = ts
-        for p in (self.cache_root / prefix).glob("*.csv"):
-            try:
-                first_ts, last_ts = p.stem.split("_")
+        manifest = self._get_manifest(prefix=prefix)
+        chunk = manifest.find(ts)
+        if not chunk:
+            return None
 
-                if not last_ts:
-                    continue
+        chunk = self._converted(prefix=prefix, chunk=chunk)
+        return (
+            Time(chunk.first_ts),
+            Time(chunk.last_ts),
+            self.cache_root / prefix / chunk.name,
+        )
 
-                first_ts = int(first_ts)
-                last_ts = int(last_ts)
+    def _converted(self, prefix: str, chunk: Chunk) -> Chunk:
+        """Converts a chunk cached as csv."""
+        if not chunk.name.endswith(".csv"):
+            return chunk
 
-                if first_ts <= second <= last_ts:
-                    return (
-                        Time(first_ts),
-                        Time(last_ts),
-                        p,
-                    )
-            except ValueError:
-                pass
+        csv_path = self.cache_root / prefix / chunk.name
+        path = self._convert_chunk(csv_path=csv_path, path=csv_path.with_suffix(".npz"))
+        converted = chunk._replace(name=path.name)
+
+        manifest = self._get_manifest(prefix=prefix)
+        manifest.remove(chunk.name)
+        manifest.add(converted)
+        manifest.save()
+        csv_path.unlink()
+
+        return converted
+
+    def _get_manifest(self, prefix: str) -> Manifest:
+        manifest = self._manifests.get(prefix)
+        if manifest is None:
+            manifest = self._manifests[prefix] = Manifest(self.cache_root / prefix)
+        return manifest
+
+    @staticmethod
+    def _compaction_groups(manifest: Manifest) -> List[List[Chunk]]:
+        """Completed chunks of each month, if there are more than one."""
+        groups = {}
+        for chunk in manifest.chunks:
+            if chunk.completed:
+                month = np.datetime64(chunk.first_ts, "s").astype("datetime64[M]")
+                groups.setdefault(month, []).append(chunk)
+
+        return [chunks for chunks in groups.values() if len(chunks) > 1]
+
+    @staticmethod
+    def _are_adjacent(data: Dict[str, np.ndarray], chunk: Chunk) -> bool:
+        """No rows are missing between the chunk data and the next chunk."""
+        ts = data["ts"]
+        steps = np.diff(ts)
+        steps = steps[steps > 0]
+        if not len(steps):
+            return False
+        return chunk.first_ts - ts[-1] <= steps.min()
+
+    @staticmethod
+    def _merge_chunks(chunks: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        """Rows sorted by ts, chunks overlap, the first row for each ts is kept."""
+        columns = {
+            name: np.concatenate([chunk[name] for chunk in chunks])
+            for name in chunks[0]
+        }
+        ts, positions = np.unique(columns["ts"], return_index=True)
+        return {name: values[positions] for name, values in columns.items()}
+
+    def _convert_chunk(self, csv_path: Path, path: Path) -> Path:
+        df = pd.read_csv(csv_path)
+        columns = {}
+        for name, values in df.items():
+            if name == "ts":
+                columns[name] = values.to_numpy(dtype=np.int64)
+            elif name in FLOAT_COLUMNS:
+                columns[name] = values.to_numpy(dtype=np.float64)
+            elif values.dtype.kind in "biuf":
+                columns[name] = values.to_numpy()
+            else:
+                columns[name] = values.to_numpy(dtype=str)
+
+        return self._write_chunk(columns=columns, path=path)
+
+    def _write_chunk(self, columns: Dict[str, np.ndarray], path: Path) -> Path:
+        # written next to the chunk and moved, readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp.npz")
+        save = np.savez_compressed if self.compression else np.savez
+        try:
+            with os.fdopen(fd, "wb") as f:
+                save(f, **columns)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        return path
+
+    def _read_chunk(self, path: Path) -> Dict[str, np.ndarray]:
+        with np.load(path) as f:
+            return {name: f[name] for name in f.files}
 
     def _build_temp_path(self, prefix: str, ts: Time):
         return prefix + f"/{int(ts)}.csv"
@@ -126,5 +452,5 @@ class DataService:
         return (
             prefix
             + f"/{int(first_ts)}_"
-            + (f"{int(last_ts)}.csv" if completed else ".csv")
+            + (f"{int(last_ts)}.npz" if completed else ".npz")
         )
@@ -0,0 +1,98 @@
+import os
+import tempfile
+from bisect import bisect_right
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+import ujson
+
+from cipher.models import Time
+
+FILENAME = "manifest.json"
+SUFFIXES = (".npz", ".csv")
+
+
+class Chunk(NamedTuple):
+    first_ts: int
+    last_ts: int
+    name: str
+    completed: bool
+
+
+class Manifest:
+    """Sorted index of the chunk files of a cache directory.
+
+    Stored as json next to the chunks and replaced atomically on change.
+    Directories cached before the manifest existed are scanned once."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / FILENAME
+        self.chunks: List[Chunk] = []
+        # max last_ts of the chunks up to each position, to stop lookups early
+        self._reach: List[int] = []
+
+        if self.path.exists():
+            self._set(Chunk(*c) for c in ujson.loads(self.path.read_text()))
+        elif root.is_dir():
+            self._set(self._scan())
+            self.save()
+
+    def find(self, ts: Time) -> Optional[Chunk]:
+        """Completed chunk containing ts."""
+        i = bisect_right(self.chunks, (ts, float("inf"))) - 1
+        while i >= 0 and self._reach[i] >= ts:
+            chunk = self.chunks[i]
+            if chunk.completed and chunk.last_ts >= ts:
+                return chunk
+            i -= 1
+        return None
+
+    def add(self, chunk: Chunk):
+        """Adds a chunk, an incomplete chunk with the same start is replaced."""
+        self._set(
+            [
+                c
+                for c in self.chunks
+                if c.name != chunk.name
+                and not (c.first_ts == chunk.first_ts and not c.completed)
+            ]
+            + [chunk]
+        )
+
+    def remove(self, name: str):
+        self._set(c for c in self.chunks if c.name != name)
+
+    def save(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(ujson.dumps([list(c) for c in self.chunks]))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _set(self, chunks):
+        self.chunks = sorted(chunks)
+        self._reach = []
+        reach = -1
+        for chunk in self.chunks:
+            reach = max(reach, chunk.last_ts)
+            self._reach.append(reach)
+
+    def _scan(self) -> List[Chunk]:
+        chunks = []
+        for p in self.root.iterdir():
+            if p.suffix not in SUFFIXES:
+                continue
+            try:
+                first_ts, last_ts = p.stem.split("_")
+                if not last_ts:
+                    # incomplete chunks are found by the name only
+                    continue
+                chunks.append(Chunk(int(first_ts), int(last_ts), p.name, True))
+            except ValueError:
+                pass
+        return chunks
@@ -14,4 +14,7 @@ class Settings(BaseSettings):
     )
 
     cache_root: Path = ".cache"
+    cache_compression: bool = False
+    fetch_jobs: int = 4
     log_level: LogLevel = LogLevel.INFO
+    numeric: str = "decimal"  # decimal or float
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional
 
 from cipher.models import Time
 
@@ -10,6 +11,14 @@ class Source(ABC):
     def slug(self):
         pass
 
+    @property
+    def page_size(self) -> Optional[int]:
+        """Seconds covered by a load call, None if loads are not paged.
+
+        Paged sources are fetched concurrently, they must be safe to call
+        from several threads and keep within the rate limit."""
+        return None
+
     @abstractmethod
     def load(
         self, ts: Time, path: Path
@@ -3,13 +3,12 @@ from pathlib import Path
 from typing import Union
 from urllib.parse import urlencode, urljoin
 
-import requests
-
 from cipher.models import Interval, Time
-from cipher.utils import RateLimiter
+from cipher.utils import RateLimiter, create_session
 from .base import Source
 
-rate_limiter = RateLimiter(calls_per_seconds=2.0)
+rate_limiter = RateLimiter(calls_per_seconds=5.0)
+session = create_session()
 
 
 class BinanceFuturesOHLCSource(Source):
@@ -41,9 +40,13 @@ class BinanceFuturesOHLCSource(Source):
     def slug(self):
         return f"binance_futures_ohlc/{self.symbol.lower()}_{self.interval.to_binance_slug()}"
 
+    @property
+    def page_size(self) -> Interval:
+        return self.interval * self.limit
+
     def load(self, ts: Time, path: Path) -> (Time, Time, bool):
         """query: start_ts, interval, symbol"""
-        start_ts = ts.block_ts(self.interval * self.limit)
+        start_ts = ts.block_ts(self.page_size)
 
         rows = self._request(
             uri="/fapi/v1/klines",
@@ -79,7 +82,7 @@ class BinanceFuturesOHLCSource(Source):
             url = "?".join([url, data_str])
 
         with rate_limiter():
-            response = requests.get(url)
+            response = session.get(url)
 
         assert response.status_code == 200, response.content
 
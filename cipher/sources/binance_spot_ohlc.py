@@ -3,13 +3,12 @@ from pathlib import Path
 from typing import Union
 from urllib.parse import urlencode, urljoin
 
-import requests
-
 from cipher.models import Interval, Time
-from cipher.utils import RateLimiter
+from cipher.utils import RateLimiter, create_session
 from .base import Source
 
-rate_limiter = RateLimiter(calls_per_seconds=2.0)
+rate_limiter = RateLimiter(calls_per_seconds=10.0)
+session = create_session()
 
 
 class BinanceSpotOHLCSource(Source):
@@ -43,9 +42,13 @@ class BinanceSpotOHLCSource(Source):
             f"binance_spot_ohlc/{self.symbol.lower()}_{self.interval.to_binance_slug()}"
         )
 
+    @property
+    def page_size(self) -> Interval:
+        return self.interval * self.limit
+
     def load(self, ts: Time, path: Path) -> (Time, Time, bool):
         """query: start_ts, interval, symbol"""
-        start_ts = ts.block_ts(self.interval * self.limit)
+        start_ts = ts.block_ts(self.page_size)
 
         rows = self._request(
             uri="/api/v3/klines",
@@ -81,7 +84,7 @@ class BinanceSpotOHLCSource(Source):
             url = "?".join([url, data_str])
 
         with rate_limiter():
-            response = requests.get(url)
+            response = session.get(url)
 
         assert response.status_code == 200, response.content
 
@@ -3,13 +3,12 @@ from pathlib import Path
 from typing import Union
 from urllib.parse import urlencode, urljoin
 
-import requests
-
 from cipher.models import Interval, Time
-from cipher.utils import RateLimiter
+from cipher.utils import RateLimiter, create_session
 from .base import Source
 
-rate_limiter = RateLimiter(calls_per_seconds=2.0)
+rate_limiter = RateLimiter(calls_per_seconds=10.0)
+session = create_session()
 
 
 class GateioSpotOHLCSource(Source):
@@ -39,8 +38,12 @@ class GateioSpotOHLCSource(Source):
             f"gateio_spot_ohlc/{self.symbol.lower()}_{self.interval.to_gateio_slug()}"
         )
 
+    @property
+    def page_size(self) -> Interval:
+        return self.interval * self.limit
+
     def load(self, ts: Time, path: Path) -> (Time, Time, bool):
-        start_ts = ts.block_ts(self.interval * self.limit)
+        start_ts = ts.block_ts(self.page_size)
 
         rows = self._request(
             uri="spot/candlesticks",
@@ -77,7 +80,7 @@ class GateioSpotOHLCSource(Source):
             url = "?".join([url, data_str])
 
         with rate_limiter():
-            response = requests.get(
+            response = session.get(
                 url,
                 headers={
                     "Accept": "application/json",
@@ -1,7 +1,12 @@
-from pandas import DataFrame
+from decimal import Decimal
+from typing import Optional, Union
+
+from pandas import DataFrame, isna
 
 from cipher.models import Datas, Wallet
 from cipher.proxies import SessionProxy as Session
+from cipher.utils import price_to_number, to_number
+from cipher.values import Base, Percent, Quote, base
 
 
 class Strategy:
@@ -32,3 +37,71 @@ class Strategy:
 
     def on_stop(self, row: dict, session: Session) -> None:
         pass
+
+
+class SignalStrategy(Strategy):
+    """Entry and exit signals with fixed brackets.
+
+    Opens a session with the same position on each entry, closes it on exit
+    signal, take profit or stop loss. Can be run with VectorTrader."""
+
+    position: Union[Base, Quote, Decimal, int, str, float] = base(1)  # < 0 for shorts
+    take_profit: Optional[Percent] = None
+    stop_loss: Optional[Percent] = None
+
+    # def compose(self) -> DataFrame:
+    #     df = self.datas.df
+    #     df["entry"] = ...
+    #     df["exit"] = ...
+    #     return df
+
+    def on_entry(self, row: dict, session: Session) -> None:
+        session.position = self.position
+        if self.take_profit:
+            session.take_profit = self.take_profit
+        if self.stop_loss:
+            session.stop_loss = self.stop_loss
+
+    def on_exit(self, row: dict, session: Session) -> None:
+        session.position = 0
+
+
+class TargetPositionStrategy(Strategy):
+    """Position follows target_position column.
+
+    target_position is a base quantity, or a fraction of equity if equity
+    (initial quote balance) is set. A new session starts each time
+    the position crosses zero. Can be run with VectorTrader."""
+
+    equity: Optional[Decimal] = None
+
+    # def compose(self) -> DataFrame:
+    #     df = self.datas.df
+    #     df["target_position"] = ...
+    #     return df
+
+    def on_step(self, row: dict, session: Session) -> None:
+        target = row["target_position"]
+        if isna(target):
+            return
+
+        target = to_number(str(float(target)))
+        if self.equity is not None:
+            price = price_to_number(row["close"])
+            equity = (
+                to_number(self.equity) + self.wallet.quote + self.wallet.base * price
+            )
+            target = target * equity / price
+
+        # the wallet is created for each run
+        wallet, current = getattr(self, "_current", (None, None))
+        if wallet is self.wallet and current.is_open:
+            if target and (target > 0) != current.is_long:
+                current.position = 0
+            else:
+                current.position = target
+                return
+
+        if target:
+            session.position = target
+            self._current = (self.wallet, session)
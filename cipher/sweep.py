@@ -0,0 +1,121 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
+
+from pandas import DataFrame
+
+from cipher.factories import VectorStatsFactory
+from cipher.models import Commission, Datas, SharedFrame
+from cipher.strategy import Strategy
+from cipher.trader import Trader
+from cipher.utils import Numeric, get_numeric, set_numeric
+
+
+class Sweep:
+    """Runs a strategy for each parameters combination.
+
+    Data is loaded once, combinations are spread across worker processes."""
+
+    def __init__(
+        self,
+        strategy_cls: Type[Strategy],
+        datas: Datas,
+        commission: Optional[Commission] = None,
+        trader_cls: Type[Trader] = Trader,
+        jobs: Optional[int] = 1,
+        capital: Union[Decimal, int, str, None] = None,
+    ):
+        self.datas = datas
+        self.worker = SweepWorker(
+            strategy_cls=strategy_cls,
+            commission=commission,
+            trader_cls=trader_cls,
+            capital=capital,
+        )
+        self.jobs = jobs or os.cpu_count()
+
+    def run(self, param_grid: Dict[str, Iterable]) -> DataFrame:
+        combinations = param_combinations(param_grid)
+        results = run_parallel(
+            worker=self.worker, tasks=combinations, datas=self.datas, jobs=self.jobs
+        )
+
+        return DataFrame([{**p, **r} for p, r in zip(combinations, results)])
+
+
+class SweepWorker:
+    def __init__(
+        self,
+        strategy_cls: Type[Strategy],
+        commission: Optional[Commission],
+        trader_cls: Type[Trader],
+        capital: Union[Decimal, int, str, None] = None,
+    ):
+        self.strategy_cls = strategy_cls
+        self.commission = commission
+        self.trader_cls = trader_cls
+        self.capital = capital
+
+    def __call__(self, datas: Datas, params: dict) -> dict:
+        output = self.trader_cls(
+            datas=datas,
+            strategy=self.strategy_cls(**params),
+        ).run()
+
+        return (
+            VectorStatsFactory(commission=self.commission, capital=self.capital)
+            .from_output(output)
+            .model_dump()
+        )
+
+
+def param_combinations(param_grid: Dict[str, Iterable]) -> List[dict]:
+    keys = list(param_grid.keys())
+    return [dict(zip(keys, values)) for values in product(*param_grid.values())]
+
+
+def run_parallel(
+    worker: Callable[[Datas, Any], Any], tasks: list, datas: Datas, jobs: int
+) -> list:
+    """Calls worker(datas, task) for each task, in worker processes if jobs > 1.
+
+    Workers map the data from shared memory instead of receiving a copy."""
+    if jobs == 1 or len(tasks) < 2:
+        # compose usually adds columns to the source dataframes
+        return [worker(Datas(df.copy() for df in datas), task) for task in tasks]
+
+    frames = [SharedFrame(df) for df in datas]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(worker, frames, get_numeric()),
+        ) as executor:
+            return list(
+                executor.map(
+                    _run_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4))
+                )
+            )
+    finally:
+        for frame in frames:
+            frame.close()
+
+
+_worker: Optional[Callable[[Datas, Any], Any]] = None
+_frames: List[SharedFrame] = []
+
+
+def _init_worker(
+    worker: Callable[[Datas, Any], Any], frames: List[SharedFrame], numeric: Numeric
+):
+    global _worker, _frames
+    _worker = worker
+    _frames = frames
+    set_numeric(numeric)
+
+
+def _run_worker(task):
+    # a new dataframe per task, columns added by compose do not leak between tasks
+    return _worker(Datas(frame.to_df() for frame in _frames), task)
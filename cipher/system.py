@@ -1,8 +1,11 @@
+from datetime import timedelta
 from decimal import Decimal
-from typing import List, Optional, Type, Union
+from typing import Dict, Iterable, List, Optional, Type, Union
+
+from pandas import DataFrame
 
 from cipher.container import Container
-from cipher.factories import StatsFactory
+from cipher.factories import ExcursionsFactory, MonteCarloFactory, StatsFactory
 from cipher.models import (
     Commission,
     Datas,
@@ -16,8 +19,17 @@ from cipher.plotters import PLOTTERS, Plotter, get_default_plotter
 from cipher.settings import Settings
 from cipher.sources import SOURCES, Source
 from cipher.strategy import Strategy
+from cipher.sweep import Sweep
 from cipher.trader import Trader
+from cipher.utils import NUMERICS, Numeric, use_numeric
 from cipher.values import Percent
+from cipher.vector_trader import VectorTrader
+from cipher.walk_forward import WalkForward
+
+TRADERS = {
+    "default": Trader,
+    "vector": VectorTrader,
+}
 
 
 class Cipher:
@@ -27,11 +39,17 @@ class Cipher:
         settings_dict.update(**settings)
         self.container.config.from_dict(settings_dict)
         self.container.init_resources()
+        numeric = settings_dict["numeric"]
+        # activated around runs and stats, other instances keep their own
+        self.numeric: Numeric = (
+            NUMERICS[numeric] if isinstance(numeric, str) else numeric
+        )
 
         self.strategy: Optional[Strategy] = None
         self.sources: List[Source] = []
         self.output: Optional[Output] = None
         self.commission: Optional[Commission] = None
+        self.capital: Optional[Decimal] = None
 
         self.data_service = self.container.data_service()
         self.df = None
@@ -51,27 +69,132 @@ class Cipher:
         else:
             self.commission = SimpleCommission(value=value)
 
-    def run(self, start_ts: Union[Time, str], stop_ts: Union[Time, str]):
+    def set_capital(self, value: Union[Decimal, int, str]):
+        """Starting capital, stats returns are relative to it."""
+        self.capital = Decimal(value)
+
+    def run(
+        self,
+        start_ts: Union[Time, str],
+        stop_ts: Union[Time, str],
+        trader: Union[Type[Trader], str] = Trader,
+    ):
         assert self.strategy
         assert self.sources
 
-        self.output = Trader(
-            datas=Datas(
-                self.data_service.load_df(
-                    source=s,
-                    start_ts=Time.from_string(start_ts),
-                    stop_ts=Time.from_string(stop_ts),
-                )
-                for s in self.sources
-            ),
-            strategy=self.strategy,
-        ).run()
+        datas = self._load_datas(start_ts=start_ts, stop_ts=stop_ts)
+        with use_numeric(self.numeric):
+            self.output = self._trader_cls(trader)(
+                datas=datas, strategy=self.strategy
+            ).run()
+
+    def sweep(
+        self,
+        strategy_cls: Type[Strategy],
+        param_grid: Dict[str, Iterable],
+        start_ts: Union[Time, str],
+        stop_ts: Union[Time, str],
+        jobs: Optional[int] = 1,
+        trader: Union[Type[Trader], str] = Trader,
+    ) -> DataFrame:
+        """Stats for each strategy parameters combination,
+        jobs=None to use all cores."""
+        assert self.sources
+
+        datas = self._load_datas(start_ts=start_ts, stop_ts=stop_ts)
+        with use_numeric(self.numeric):
+            return Sweep(
+                strategy_cls=strategy_cls,
+                datas=datas,
+                commission=self.commission,
+                trader_cls=self._trader_cls(trader),
+                jobs=jobs,
+                capital=self.capital,
+            ).run(param_grid)
+
+    def walk_forward(
+        self,
+        strategy_cls: Type[Strategy],
+        param_grid: Dict[str, Iterable],
+        start_ts: Union[Time, str],
+        stop_ts: Union[Time, str],
+        train: Union[timedelta, str],
+        test: Union[timedelta, str],
+        metric: str = "pnl",
+        jobs: Optional[int] = 1,
+        trader: Union[Type[Trader], str] = Trader,
+    ) -> DataFrame:
+        """Walk-forward optimization, out-of-sample sessions are stored as output.
+
+        Returns chosen parameters for each window, the metric is a Stats field."""
+        assert self.sources
+
+        datas = self._load_datas(start_ts=start_ts, stop_ts=stop_ts)
+        with use_numeric(self.numeric):
+            self.output, windows = WalkForward(
+                strategy_cls=strategy_cls,
+                datas=datas,
+                train=train,
+                test=test,
+                metric=metric,
+                commission=self.commission,
+                trader_cls=self._trader_cls(trader),
+                jobs=jobs,
+                capital=self.capital,
+            ).run(param_grid)
+
+        return windows
+
+    def _load_datas(
+        self, start_ts: Union[Time, str], stop_ts: Union[Time, str]
+    ) -> Datas:
+        return Datas(
+            self.data_service.load_df(
+                source=s,
+                start_ts=Time.from_string(start_ts),
+                stop_ts=Time.from_string(stop_ts),
+            )
+            for s in self.sources
+        )
+
+    def _trader_cls(self, trader: Union[Type[Trader], str]) -> Type[Trader]:
+        return TRADERS[trader] if isinstance(trader, str) else trader
 
     @property
     def stats(self) -> Stats:
         assert self.output
 
-        return StatsFactory(commission=self.commission).from_output(self.output)
+        return StatsFactory(
+            commission=self.commission, capital=self.capital
+        ).from_output(self.output)
+
+    @property
+    def excursions(self) -> DataFrame:
+        """MAE and MFE of each closed session."""
+        assert self.output
+
+        return ExcursionsFactory().from_output(self.output)
+
+    def monte_carlo(
+        self,
+        paths: int = 10000,
+        method: str = "shuffle",
+        block_size: int = 5,
+        jobs: Optional[int] = 1,
+        seed: Optional[int] = None,
+    ) -> DataFrame:
+        """Final pnl, max drawdown and longest losing streak for each path
+        of resampled closed session pnls, method is "shuffle" or "block"."""
+        assert self.output
+
+        return MonteCarloFactory(
+            commission=self.commission,
+            paths=paths,
+            method=method,
+            block_size=block_size,
+            jobs=jobs,
+            seed=seed,
+        ).from_output(self.output)
 
     @property
     def sessions(self):
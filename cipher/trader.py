@@ -1,10 +1,24 @@
 import inspect
 import re
-from typing import List, Optional
-
-from pandas import BooleanDtype, DataFrame, Series, isna
-
-from cipher.models import Cursor, Datas, Output, Session, Sessions, Wallet
+from decimal import Decimal
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from pandas import BooleanDtype, DataFrame, Series
+
+from cipher.models import (
+    BracketBook,
+    Cursor,
+    Datas,
+    Ledger,
+    OpenSessions,
+    Output,
+    Rows,
+    Session,
+    Sessions,
+    Time,
+    Wallet,
+)
 from cipher.proxies import SessionProxy
 from cipher.strategy import Strategy
 
@@ -19,7 +33,14 @@ class Trader:
         self.strategy.wallet = Wallet()
 
         sessions = Sessions()
+        open_sessions = OpenSessions()
+        bracket_book = BracketBook()
         cursor = Cursor()
+        ledger = Ledger()
+
+        def on_change(session: SessionProxy):
+            open_sessions.update(session)
+            bracket_book.update(session)
 
         signals = self._extract_strategy_signal_handlers()
 
@@ -29,78 +50,106 @@ class Trader:
         self._ensure_df_signals_type(df, signals=signals)
         self._cut_df_nulls(df)
 
-        row_dict = {}
-        new_session = None
-        for ts, row in df.iterrows():
-            row_dict = dict(row)
+        rows = Rows(df)
+        timestamps = df.index.values.astype("datetime64[s]").astype("int64")
+        closes = df["close"].to_numpy(dtype=np.float64)
+        lows = df["low"].to_numpy(dtype=np.float64)
+        highs = df["high"].to_numpy(dtype=np.float64)
+        flags = {
+            signal: df[signal].to_numpy(dtype=bool, na_value=False)
+            for signal in signals
+        }
+        exit_flags = [(s, f) for s, f in flags.items() if s != "entry"]
+        entry_flags = flags["entry"]
+
+        if self._has_on_step():
+            schedule = range(len(rows))
+        else:
+            schedule = self._schedule(
+                events=np.flatnonzero(np.logical_or.reduce(list(flags.values()))),
+                bracket_book=bracket_book,
+                lows=lows,
+                highs=highs,
+            )
 
-            cursor.set(ts=ts, price=row_dict["close"])
+        # wallet after the bars where it changed, for the equity curve
+        marks = []
+        recorded = 0
 
-            new_session = new_session or SessionProxy(
-                Session(),
-                wallet=self.strategy.wallet,
-                cursor=cursor,
+        i = None
+        new_session = None
+        for i in schedule:
+            row = rows[i]
+            cursor.set(ts=Time(timestamps[i]), price=closes[i])
+
+            new_session = new_session or self._new_session(
+                cursor=cursor, on_change=on_change, ledger=ledger
             )
 
             self.strategy.on_step(
-                row=row_dict,
+                row=row,
                 session=new_session,
             )
             if new_session.position.value != 0:
                 sessions.append(new_session)
-                new_session = SessionProxy(
-                    Session(),
-                    wallet=self.strategy.wallet,
-                    cursor=cursor,
+                open_sessions.add(new_session)
+                new_session = self._new_session(
+                    cursor=cursor, on_change=on_change, ledger=ledger
                 )
 
             # loop because take_profit/stop_loss can be triggered multiple times for a row,
             # in case of partial take profit, for example
-            for i in range(10):
-                has_tp_sl = False
-                for session in sessions.open_sessions:
-                    if session.take_profit or session.stop_loss:
-                        take_profit, stop_loss = session.should_tp_sl(
-                            low=row_dict["low"], high=row_dict["high"]
-                        )
-                        has_tp_sl = True
-                    else:
-                        continue
+            for _ in range(10):
+                triggered = bracket_book.pop_triggered(low=lows[i], high=highs[i])
+                if not triggered:
+                    break
 
+                for session in open_sessions.sort(triggered):
+                    take_profit, stop_loss = session.should_tp_sl(
+                        low=lows[i], high=highs[i]
+                    )
                     if take_profit:
                         with cursor.patch_price(take_profit):
-                            self.strategy.on_take_profit(row=row_dict, session=session)
+                            self.strategy.on_take_profit(row=row, session=session)
                     if stop_loss:
                         with cursor.patch_price(stop_loss):
-                            self.strategy.on_stop_loss(row=row_dict, session=session)
+                            self.strategy.on_stop_loss(row=row, session=session)
 
-                if not has_tp_sl:
-                    break
+                for session in triggered:
+                    bracket_book.update(session)
 
-            for signal in signals:
-                if signal == "entry":
-                    continue
-                if isna(row[signal]) or not row[signal]:
+            for signal, signal_flags in exit_flags:
+                if not signal_flags[i]:
                     continue
-                for session in sessions.open_sessions:
+                for session in open_sessions:
                     getattr(self.strategy, f"on_{signal}")(row=row, session=session)
 
-            if not isna(row["entry"]) and row["entry"]:
-                new_session = SessionProxy(
-                    Session(),
-                    wallet=self.strategy.wallet,
-                    cursor=cursor,
+            if entry_flags[i]:
+                new_session = self._new_session(
+                    cursor=cursor, on_change=on_change, ledger=ledger
                 )
                 self.strategy.on_entry(
-                    row=row_dict,
+                    row=row,
                     session=new_session,
                 )
                 if new_session.position.value != 0:
                     sessions.append(new_session)
+                    open_sessions.add(new_session)
                     new_session = None
 
-        for session in sessions.open_sessions:
-            self.strategy.on_stop(row=row_dict, session=session)
+            if len(ledger) != recorded:
+                recorded = len(ledger)
+                marks.append(self._mark(i))
+
+        last_i = len(rows) - 1
+        if i != last_i:
+            cursor.set(ts=Time(timestamps[last_i]), price=closes[last_i])
+        row = rows[last_i]
+
+        for session in open_sessions:
+            self.strategy.on_stop(row=row, session=session)
+        if len(ledger) != recorded:
+            marks.append(self._mark(last_i))
 
         return Output(
             df=df,
@@ -108,6 +157,110 @@ class Trader:
             signals=signals,
             title=self._extract_strategy_title(),
             description=self._extract_strategy_description(),
+            ledger=ledger,
+            equity=self._equity(df, marks=marks),
+        )
+
+    def _mark(self, i: int) -> Tuple[int, float, float]:
+        wallet = self.strategy.wallet
+        return i, float(wallet.base), float(wallet.quote)
+
+    def _equity(
+        self, df: DataFrame, marks: List[Tuple[int, float, float]]
+    ) -> DataFrame:
+        """Position, quote and balance for each bar,
+        the wallet stays the same between marked bars."""
+        bars, positions, quotes = (
+            np.array(column) for column in (zip(*marks) if marks else ([], [], []))
+        )
+        counts = np.searchsorted(bars, np.arange(len(df)), side="right")
+        position = np.r_[0.0, positions][counts]
+        quote = np.r_[0.0, quotes][counts]
+
+        return DataFrame(
+            {
+                "position": position,
+                "quote": quote,
+                "balance": position * df["close"].to_numpy(dtype=np.float64) + quote,
+            },
+            index=df.index,
+        )
+
+    def _has_on_step(self) -> bool:
+        return self.strategy.__class__.on_step is not Strategy.on_step
+
+    def _schedule(
+        self,
+        events: np.ndarray,
+        bracket_book: BracketBook,
+        lows: np.ndarray,
+        highs: np.ndarray,
+    ) -> Iterator[int]:
+        """Bars where something can happen: signals and bracket hits.
+
+        Used when the strategy has no on_step, the rest of the bars are skipped."""
+        length = len(lows)
+        i = -1
+        while True:
+            n = np.searchsorted(events, i + 1)
+            next_i = events[n] if n < len(events) else length
+
+            if len(bracket_book) and i + 1 < next_i:
+                next_i = self._find_bracket_hit(
+                    start=i + 1,
+                    stop=next_i,
+                    bounds=bracket_book.bounds(),
+                    lows=lows,
+                    highs=highs,
+                )
+
+            if next_i >= length:
+                return
+
+            i = int(next_i)
+            yield i
+
+    def _find_bracket_hit(
+        self,
+        start: int,
+        stop: int,
+        bounds: Tuple[Optional[Decimal], Optional[Decimal]],
+        lows: np.ndarray,
+        highs: np.ndarray,
+    ) -> int:
+        """First bar in range that may trigger a bracket, or stop."""
+        below, above = bounds
+        # a bar can be included that does not trigger anything, but never skipped
+        below = np.nextafter(float(below), np.inf) if below else None
+        above = np.nextafter(float(above), -np.inf) if above else None
+
+        size = 16
+        while start < stop:
+            end = min(start + size, stop)
+            hits = np.zeros(end - start, dtype=bool)
+            if below is not None:
+                hits |= lows[start:end] < below
+            if above is not None:
+                hits |= highs[start:end] > above
+            if hits.any():
+                return start + int(hits.argmax())
+            start = end
+            size *= 2
+
+        return stop
+
+    def _new_session(
+        self,
+        cursor: Cursor,
+        on_change: Callable[[SessionProxy], None],
+        ledger: Ledger,
+    ) -> SessionProxy:
+        return SessionProxy(
+            Session(),
+            wallet=self.strategy.wallet,
+            cursor=cursor,
+            on_change=on_change,
+            ledger=ledger,
         )
 
     def _extract_strategy_signal_handlers(self) -> List[str]:
@@ -1,13 +1,39 @@
 from .colors import create_palette
 from .decimals import float_to_decimal, to_decimal
 from .environment import in_colab, in_notebook
+from .http import create_session
+from .numeric import (
+    NUMERICS,
+    DecimalNumeric,
+    FloatNumeric,
+    Number,
+    Numeric,
+    get_numeric,
+    price_to_number,
+    set_numeric,
+    to_number,
+    use_numeric,
+)
 from .rate_limit import RateLimiter
+from .slotted import Slotted
 
 __all__ = (
     "create_palette",
+    "create_session",
+    "DecimalNumeric",
     "float_to_decimal",
+    "FloatNumeric",
+    "get_numeric",
     "in_colab",
     "in_notebook",
+    "Number",
+    "Numeric",
+    "NUMERICS",
+    "price_to_number",
     "RateLimiter",
+    "set_numeric",
+    "Slotted",
     "to_decimal",
+    "to_number",
+    "use_numeric",
 )
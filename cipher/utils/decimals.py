@@ -2,8 +2,14 @@ import math
 from decimal import Decimal
 from typing import Union
 
+import numpy as np
+
 
 def to_decimal(value: Union[int, str, Decimal, float]) -> Decimal:
+    if isinstance(value, np.generic):
+        # numpy scalars from dataframe columns
+        value = value.item()
+
     if isinstance(value, Decimal):
         return value
     elif isinstance(value, (int, str)):
@@ -19,6 +25,8 @@ def float_to_decimal(value: Union[float, int]) -> Decimal:
     that should be ok for prices."""
     if isinstance(value, Decimal):
         return value
+    if isinstance(value, np.generic):
+        value = value.item()
 
     assert isinstance(value, (float, int))
 
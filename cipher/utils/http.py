@@ -0,0 +1,11 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """Session keeping up to pool_size connections alive per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,102 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Annotated, Iterator, Union
+
+from pydantic import PlainValidator, TypeAdapter
+
+from .decimals import float_to_decimal, to_decimal
+
+
+class Numeric(ABC):
+    """Numbers type used for prices, amounts and stats."""
+
+    zero: Union[Decimal, float]
+
+    @abstractmethod
+    def from_value(self, value: Union[int, str, float, Decimal]):
+        """Amounts and prices set by strategies."""
+
+    @abstractmethod
+    def from_price(self, value: Union[int, float, Decimal]):
+        """Prices from the dataframe."""
+
+    @abstractmethod
+    def validate(self, value):
+        """Model fields."""
+
+
+class DecimalNumeric(Numeric):
+    zero = Decimal(0)
+
+    def __init__(self):
+        self._adapter = TypeAdapter(Decimal)
+
+    def from_value(self, value: Union[int, str, float, Decimal]) -> Decimal:
+        return to_decimal(value)
+
+    def from_price(self, value: Union[int, float, Decimal]) -> Decimal:
+        return float_to_decimal(value)
+
+    def validate(self, value) -> Decimal:
+        if isinstance(value, Decimal):
+            return value
+        return self._adapter.validate_python(value)
+
+
+class FloatNumeric(Numeric):
+    """Native floats, faster but not exact."""
+
+    zero = 0.0
+
+    def from_value(self, value: Union[int, str, float, Decimal]) -> float:
+        return float(value)
+
+    def from_price(self, value: Union[int, float, Decimal]) -> float:
+        return float(value)
+
+    def validate(self, value) -> float:
+        return float(value)
+
+
+NUMERICS = {
+    "decimal": DecimalNumeric(),
+    "float": FloatNumeric(),
+}
+
+_numeric: Numeric = NUMERICS["decimal"]
+
+
+def get_numeric() -> Numeric:
+    return _numeric
+
+
+def set_numeric(numeric: Union[Numeric, str]):
+    global _numeric
+    _numeric = NUMERICS[numeric] if isinstance(numeric, str) else numeric
+
+
+@contextmanager
+def use_numeric(numeric: Union[Numeric, str]) -> Iterator[Numeric]:
+    """Makes the numeric current within the block, the previous one is restored."""
+    global _numeric
+    saved_numeric = _numeric
+    set_numeric(numeric)
+    try:
+        yield _numeric
+    finally:
+        _numeric = saved_numeric
+
+
+def to_number(value: Union[int, str, float, Decimal]) -> Union[Decimal, float]:
+    return _numeric.from_value(value)
+
+
+def price_to_number(value: Union[int, float, Decimal]) -> Union[Decimal, float]:
+    return _numeric.from_price(value)
+
+
+# model field, validated by the current numeric
+Number = Annotated[
+    Union[Decimal, float], PlainValidator(lambda value: _numeric.validate(value))
+]
@@ -1,20 +1,25 @@
 import time
 from contextlib import contextmanager
+from threading import Lock
 
 
 class RateLimiter:
+    """Spaces calls out evenly, can be shared between threads.
+
+    Each call reserves the next free slot under the lock and waits outside it."""
+
     def __init__(self, calls_per_seconds: float):
         self.last_call_ts = time.monotonic() - (1 / calls_per_seconds) * 2
         self.calls_per_second = calls_per_seconds
+        self._lock = Lock()
 
     @contextmanager
     def __call__(self):
-        now = time.monotonic()
-        to_wait = self.last_call_ts - now + (1 / self.calls_per_second)
-        if to_wait > 0:
-            time.sleep(to_wait)
+        with self._lock:
             now = time.monotonic()
-        try:
-            yield
-        finally:
-            self.last_call_ts = now
+            call_ts = max(now, self.last_call_ts + (1 / self.calls_per_second))
+            self.last_call_ts = call_ts
+
+        if call_ts > now:
+            time.sleep(call_ts - now)
+        yield
@@ -1,14 +1,15 @@
 from decimal import Decimal
 from typing import Union
 
-from pydantic import BaseModel
+from ..utils import Number, Slotted, to_number
 
-from ..utils import to_decimal
 
+class Base(Slotted):
+    __slots__ = ("value",)
 
-class Base(BaseModel):
-    value: Decimal
+    def __init__(self, value: Number):
+        self.value = value
 
 
 def base(value: Union[int, str, float, Decimal]):
-    return Base(value=to_decimal(value))
+    return Base(value=to_number(value))
@@ -1,14 +1,15 @@
 from decimal import Decimal
 from typing import Union
 
-from pydantic import BaseModel
+from ..utils import Number, Slotted, to_number
 
-from ..utils import to_decimal
 
+class Percent(Slotted):
+    __slots__ = ("value",)
 
-class Percent(BaseModel):
-    value: Decimal
+    def __init__(self, value: Number):
+        self.value = value
 
 
 def percent(value: Union[int, str, float, Decimal]):
-    return Percent(value=to_decimal(value))
+    return Percent(value=to_number(value))
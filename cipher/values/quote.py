@@ -1,14 +1,15 @@
 from decimal import Decimal
 from typing import Union
 
-from pydantic import BaseModel
+from ..utils import Number, Slotted, to_number
 
-from .percent import to_decimal
 
+class Quote(Slotted):
+    __slots__ = ("value",)
 
-class Quote(BaseModel):
-    value: Decimal
+    def __init__(self, value: Number):
+        self.value = value
 
 
 def quote(value: Union[int, str, float, Decimal]):
-    return Quote(value=to_decimal(value))
+    return Quote(value=to_number(value))
@@ -0,0 +1,269 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from cipher.models import Output, Session, Sessions, Time, Transaction, Wallet
+from cipher.strategy import SignalStrategy, TargetPositionStrategy
+from cipher.trader import Trader
+from cipher.utils import Number, get_numeric, price_to_number, to_number
+from cipher.values import Base, Percent, Quote
+
+# order of transactions within a bar, same as in Trader
+BRACKET_PHASE = 0
+EXIT_PHASE = 1
+ENTRY_PHASE = 2
+
+
+class VectorTrader(Trader):
+    """Runs SignalStrategy and TargetPositionStrategy without calling
+    the strategy for each bar.
+
+    Session open and close bars are found with numpy,
+    the output is the same as Trader output."""
+
+    def run(self) -> Output:
+        if not isinstance(self.strategy, (SignalStrategy, TargetPositionStrategy)):
+            raise ValueError(
+                "VectorTrader supports SignalStrategy and TargetPositionStrategy only."
+            )
+
+        self.strategy.datas = self.datas
+        self.strategy.wallet = Wallet()
+
+        signals = self._extract_strategy_signal_handlers()
+        if isinstance(self.strategy, SignalStrategy) and set(signals) != {
+            "entry",
+            "exit",
+        }:
+            raise ValueError("VectorTrader supports entry and exit signals only.")
+
+        df = self.strategy.compose()
+        self._ensure_df_not_empty(df)
+        self._ensure_df_entry(df)
+        self._ensure_df_signals_type(df, signals=signals)
+        self._cut_df_nulls(df)
+
+        if isinstance(self.strategy, TargetPositionStrategy):
+            sessions, transactions = self._target_position_sessions(df)
+        else:
+            sessions, transactions = self._signal_sessions(df)
+
+        for transaction in transactions:
+            self.strategy.wallet.apply(transaction)
+
+        return Output(
+            df=df,
+            sessions=sessions,
+            signals=signals,
+            title=self._extract_strategy_title(),
+            description=self._extract_strategy_description(),
+        )
+
+    def _signal_sessions(self, df: DataFrame) -> Tuple[Sessions, List[Transaction]]:
+        timestamps = df.index.values.astype("datetime64[s]").astype("int64")
+        closes = df["close"].to_numpy(dtype=np.float64)
+        lows = df["low"].to_numpy(dtype=np.float64)
+        highs = df["high"].to_numpy(dtype=np.float64)
+
+        length = len(df)
+        entries = np.flatnonzero(df["entry"].to_numpy(dtype=bool, na_value=False))
+        exits = np.flatnonzero(df["exit"].to_numpy(dtype=bool, na_value=False))
+        # the last exit is a stub, sessions without exit signals are never closed by it
+        exits = np.append(exits, length)
+        next_exits = exits[np.searchsorted(exits, entries, side="right")]
+
+        sessions = Sessions()
+        fills = []
+        for entry_i, exit_i in zip(entries.tolist(), next_exits.tolist()):
+            price = price_to_number(closes[entry_i])
+            quantity = self._parse_quantity(price)
+            if not quantity:
+                continue
+
+            is_long = quantity > 0
+            take_profit = self._parse_bracket(self.strategy.take_profit, price=price)
+            stop_loss = self._parse_bracket(self.strategy.stop_loss, price=price)
+            if take_profit:
+                assert (take_profit > price) if is_long else (take_profit < price)
+            if stop_loss:
+                assert (stop_loss < price) if is_long else (stop_loss > price)
+
+            session = Session(take_profit=take_profit, stop_loss=stop_loss)
+            session.transactions.append(
+                Transaction(
+                    ts=Time(timestamps[entry_i]),
+                    base=quantity,
+                    quote=-quantity * price,
+                )
+            )
+            fills.append((entry_i, ENTRY_PHASE, len(sessions), session.transactions[0]))
+
+            close = self._find_close(
+                start=entry_i + 1,
+                exit_i=exit_i,
+                is_long=is_long,
+                take_profit=take_profit,
+                stop_loss=stop_loss,
+                closes=closes,
+                lows=lows,
+                highs=highs,
+            )
+            if close:
+                close_i, phase, close_price = close
+                session.transactions.append(
+                    Transaction(
+                        ts=Time(timestamps[close_i]),
+                        base=-quantity,
+                        quote=quantity * close_price,
+                    )
+                )
+                fills.append((close_i, phase, len(sessions), session.transactions[1]))
+
+            sessions.append(session)
+
+        fills.sort(key=lambda f: f[:3])
+
+        return sessions, [f[-1] for f in fills]
+
+    def _target_position_sessions(
+        self, df: DataFrame
+    ) -> Tuple[Sessions, List[Transaction]]:
+        if "target_position" not in df.columns:
+            raise ValueError("target_position column is missing in the dataframe.")
+
+        timestamps = df.index.values.astype("datetime64[s]").astype("int64")
+        closes = df["close"].to_numpy(dtype=np.float64)
+        targets = df["target_position"].astype("float64").ffill().fillna(0).to_numpy()
+
+        if self.strategy.equity is not None:
+            # equity changes with the previous bar position
+            returns = np.zeros(len(closes))
+            returns[1:] = closes[1:] / closes[:-1] - 1
+            growth = 1 + np.r_[0, targets[:-1]] * returns
+            equity = float(self.strategy.equity) * np.cumprod(growth)
+            targets = targets * equity / closes
+
+        changes = np.flatnonzero(np.diff(targets, prepend=0.0))
+        current = targets[changes]
+        previous = np.r_[0.0, current[:-1]]
+        crossed = np.sign(current) != np.sign(previous)
+        session_closes = crossed & (previous != 0)
+        session_opens = crossed & (current != 0)
+
+        sessions = Sessions()
+        transactions = []
+        session = None
+        value = get_numeric().zero
+        for i, target, close, open_ in zip(
+            changes.tolist(),
+            current.tolist(),
+            session_closes.tolist(),
+            session_opens.tolist(),
+        ):
+            ts = Time(timestamps[i])
+            price = price_to_number(closes[i])
+
+            if close:
+                transactions.append(
+                    self._fill(session, base=-value, ts=ts, price=price)
+                )
+                value = get_numeric().zero
+            if open_:
+                session = Session()
+                sessions.append(session)
+
+            target = to_number(str(target))
+            if target != value:
+                transactions.append(
+                    self._fill(session, base=target - value, ts=ts, price=price)
+                )
+                value = target
+
+        return sessions, transactions
+
+    def _fill(self, session: Session, base: Number, ts: Time, price: Number):
+        transaction = Transaction(ts=ts, base=base, quote=-base * price)
+        session.transactions.append(transaction)
+        return transaction
+
+    def _find_close(
+        self,
+        start: int,
+        exit_i: int,
+        is_long: bool,
+        take_profit: Optional[Number],
+        stop_loss: Optional[Number],
+        closes: np.ndarray,
+        lows: np.ndarray,
+        highs: np.ndarray,
+    ) -> Optional[Tuple[int, int, Number]]:
+        """Close bar, phase and price.
+
+        Brackets are checked before the exit signal, including the exit bar."""
+        if is_long:
+            bounds = (stop_loss, take_profit)
+        else:
+            bounds = (take_profit, stop_loss)
+
+        stop = min(exit_i + 1, len(closes))
+        while (take_profit or stop_loss) and start < stop:
+            i = self._find_bracket_hit(
+                start=start, stop=stop, bounds=bounds, lows=lows, highs=highs
+            )
+            if i >= stop:
+                break
+
+            price = self._bracket_hit(
+                is_long=is_long,
+                take_profit=take_profit,
+                stop_loss=stop_loss,
+                low=lows[i],
+                high=highs[i],
+            )
+            if price:
+                return i, BRACKET_PHASE, price
+
+            start = i + 1
+
+        if exit_i < len(closes):
+            return exit_i, EXIT_PHASE, price_to_number(closes[exit_i])
+
+        return None
+
+    def _bracket_hit(
+        self,
+        is_long: bool,
+        take_profit: Optional[Number],
+        stop_loss: Optional[Number],
+        low: float,
+        high: float,
+    ) -> Optional[Number]:
+        """Same as SessionProxy.should_tp_sl, stop loss first."""
+        if is_long:
+            if stop_loss and low < stop_loss:
+                return stop_loss
+            elif take_profit and high > take_profit:
+                return take_profit
+        else:
+            if stop_loss and high > stop_loss:
+                return stop_loss
+            elif take_profit and low < take_profit:
+                return take_profit
+        return None
+
+    def _parse_quantity(self, price: Number) -> Number:
+        position = self.strategy.position
+        if isinstance(position, Base):
+            return to_number(position.value)
+        elif isinstance(position, Quote):
+            return to_number(position.value) / price
+        else:
+            return to_number(position)
+
+    def _parse_bracket(
+        self, value: Optional[Percent], price: Number
+    ) -> Optional[Number]:
+        if not value:
+            return None
+        return (to_number(value.value) / 100 + 1) * price
@@ -0,0 +1,198 @@
+import os
+from datetime import timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
+
+import pandas as pd
+from pandas import DataFrame, Timestamp
+
+from cipher.factories import VectorStatsFactory
+from cipher.models import (
+    Commission,
+    Datas,
+    Ledger,
+    Output,
+    Sessions,
+    Time,
+    Transaction,
+)
+from cipher.strategy import Strategy
+from cipher.sweep import param_combinations, run_parallel
+from cipher.trader import Trader
+from cipher.utils import price_to_number
+
+# train start, test start, test stop
+Window = Tuple[Timestamp, Timestamp, Timestamp]
+
+
+class WalkForward:
+    """Walk-forward optimization.
+
+    Parameters are chosen on a rolling train window, the best combination runs
+    on the next out-of-sample test window. Test windows follow each other,
+    out-of-sample sessions are stitched into one output.
+
+    Windows are independent and run in worker processes,
+    each of them slices the same loaded data."""
+
+    def __init__(
+        self,
+        strategy_cls: Type[Strategy],
+        datas: Datas,
+        train: Union[timedelta, str],
+        test: Union[timedelta, str],
+        metric: str = "pnl",
+        commission: Optional[Commission] = None,
+        trader_cls: Type[Trader] = Trader,
+        jobs: Optional[int] = 1,
+        capital: Union[Decimal, int, str, None] = None,
+    ):
+        self.datas = datas
+        self.train = pd.Timedelta(train)
+        self.test = pd.Timedelta(test)
+        self.strategy_cls = strategy_cls
+        self.metric = metric
+        self.commission = commission
+        self.trader_cls = trader_cls
+        self.jobs = jobs or os.cpu_count()
+        self.capital = capital
+
+    def run(self, param_grid: Dict[str, Iterable]) -> Tuple[Output, DataFrame]:
+        """Stitched out-of-sample output and chosen parameters for each window."""
+        windows = self._windows()
+        if not windows:
+            raise ValueError("Not enough data for a train and a test window.")
+
+        worker = WalkForwardWorker(
+            strategy_cls=self.strategy_cls,
+            param_grid=param_grid,
+            metric=self.metric,
+            commission=self.commission,
+            trader_cls=self.trader_cls,
+            capital=self.capital,
+        )
+        results = run_parallel(
+            worker=worker, tasks=windows, datas=self.datas, jobs=self.jobs
+        )
+
+        outputs = [output for _, output in results]
+        output = Output(
+            df=pd.concat([o.df for o in outputs]),
+            sessions=Sessions(s for o in outputs for s in o.sessions),
+            signals=outputs[0].signals,
+            title=outputs[0].title,
+            description=outputs[0].description,
+            ledger=Ledger.concat(o.ledger for o in outputs),
+        )
+
+        return output, DataFrame(
+            [
+                {
+                    "train_start": train_start,
+                    "test_start": test_start,
+                    "test_stop": test_stop,
+                    **params,
+                }
+                for (train_start, test_start, test_stop), (params, _) in zip(
+                    windows, results
+                )
+            ]
+        )
+
+    def _windows(self) -> List[Window]:
+        index = self.datas.df.index
+        if not len(index):
+            return []
+
+        windows = []
+        train_start = index[0]
+        while train_start + self.train <= index[-1]:
+            test_start = train_start + self.train
+            windows.append((train_start, test_start, test_start + self.test))
+            train_start += self.test
+
+        return windows
+
+
+class WalkForwardWorker:
+    def __init__(
+        self,
+        strategy_cls: Type[Strategy],
+        param_grid: Dict[str, Iterable],
+        metric: str,
+        commission: Optional[Commission],
+        trader_cls: Type[Trader],
+        capital: Union[Decimal, int, str, None] = None,
+    ):
+        self.strategy_cls = strategy_cls
+        self.combinations = param_combinations(param_grid)
+        self.metric = metric
+        self.commission = commission
+        self.trader_cls = trader_cls
+        self.capital = capital
+
+    def __call__(self, datas: Datas, window: Window) -> Tuple[dict, Output]:
+        train_start, test_start, test_stop = window
+
+        best_params = self.combinations[0]
+        best_score = None
+        for params in self.combinations:
+            output = self._run(datas, params=params, start=train_start, stop=test_start)
+            score = getattr(
+                VectorStatsFactory(
+                    commission=self.commission, capital=self.capital
+                ).from_output(output),
+                self.metric,
+            )
+            if score is not None and (best_score is None or score > best_score):
+                best_params = params
+                best_score = score
+
+        # the train window is included, so indicators are warmed up
+        output = self._run(datas, params=best_params, start=train_start, stop=test_stop)
+        test_start_ts = Time.from_datetime(test_start)
+
+        def in_test(session) -> bool:
+            return session.transactions[0].ts >= test_start_ts
+
+        df = output.df[output.df.index >= test_start]
+        ledger = output.ledger.filter(in_test)
+        self._close_sessions(ledger, df=df)
+
+        return best_params, Output(
+            df=df,
+            sessions=output.sessions.filter(in_test),
+            signals=output.signals,
+            title=output.title,
+            description=output.description,
+            ledger=ledger,
+        )
+
+    @staticmethod
+    def _close_sessions(ledger: Ledger, df: DataFrame):
+        """Closes sessions still open at the last bar of the window,
+        so the next window starts flat."""
+        if not len(df):
+            return
+
+        ts = Time.from_datetime(df.index[-1])
+        price = price_to_number(df["close"].iloc[-1])
+        for session_id, session in enumerate(ledger.sessions):
+            if session.is_open:
+                base = session.base
+                transaction = Transaction(ts=ts, base=-base, quote=base * price)
+                session.transactions.append(transaction)
+                ledger.append(transaction, session_id=session_id)
+
+    def _run(
+        self, datas: Datas, params: dict, start: Timestamp, stop: Timestamp
+    ) -> Output:
+        return self.trader_cls(
+            datas=Datas(
+                df.iloc[
+                    df.index.searchsorted(start) : df.index.searchsorted(stop)
+                ].copy()
+                for df in datas
+            ),
+            strategy=self.strategy_cls(**params),
+        ).run()
@@ -1,4 +1,4 @@
-from .fixtures import df, output
+from .fixtures import df, float_numeric, ohlc_df, output
 
 
-__all__ = ("df", "output")
+__all__ = ("df", "float_numeric", "ohlc_df", "output")
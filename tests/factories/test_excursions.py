@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import numpy as np
+from pandas import DataFrame, date_range
+
+from cipher.factories import ExcursionsFactory
+from cipher.models import (
+    Datas,
+    Output,
+    Session,
+    Sessions,
+    Time,
+    Transaction,
+    Transactions,
+)
+from cipher.trader import Trader
+
+from ..trader.test_run import BracketsStrategy
+
+
+def create_session(opened_i: int, closed_i: int, base: int, price: int) -> Session:
+    base = Decimal(base)
+    return Session(
+        transactions=Transactions(
+            [
+                Transaction(ts=Time(opened_i * 3600), base=base, quote=-base * price),
+                Transaction(ts=Time(closed_i * 3600), base=-base, quote=base * price),
+            ]
+        )
+    )
+
+
+def test_excursions():
+    df = DataFrame(
+        {
+            "low": [9.0, 8.0, 7.0, 9.0, 6.0],
+            "high": [11.0, 12.0, 10.0, 13.0, 10.0],
+            "close": [10.0, 10.0, 10.0, 10.0, 10.0],
+        },
+        index=date_range("1970-01-01", periods=5, freq="h"),
+    )
+    sessions = Sessions(
+        [
+            create_session(0, 3, base=1, price=10),
+            create_session(1, 4, base=-1, price=10),
+            create_session(2, 2, base=1, price=10),
+        ]
+    )
+    output = Output(df=df, sessions=sessions, signals=[], title="")
+
+    result = ExcursionsFactory().from_output(output)
+
+    assert result["mae"].tolist() == [3.0, 3.0, 0.0]
+    assert result["mae_i"].tolist() == [2, 3, 2]
+    assert result["mfe"].tolist() == [3.0, 4.0, 0.0]
+    assert result["mfe_i"].tolist() == [3, 4, 2]
+    assert result["is_long"].tolist() == [True, False, True]
+
+
+def test_excursions_trader(ohlc_df):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+
+    result = ExcursionsFactory().from_output(output)
+
+    assert len(result) == len(output.sessions.closed_sessions)
+    assert (result[["mae", "mfe"]] >= 0).all().all()
+    assert (
+        result["mae_i"] <= np.searchsorted(ohlc_df.index, result["closed_ts"])
+    ).all()
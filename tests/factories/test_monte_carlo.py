@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from cipher.factories import MonteCarloFactory, StatsFactory
+from cipher.models import Datas, Output, Sessions, SimpleCommission
+from cipher.trader import Trader
+
+from ..trader.test_run import BracketsStrategy
+
+
+@pytest.fixture
+def trader_output(ohlc_df):
+    return Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+
+
+def test_shuffle(trader_output):
+    commission = SimpleCommission("0.001")
+    stats = StatsFactory(commission=commission).from_output(trader_output)
+
+    result = MonteCarloFactory(commission=commission, paths=2500, seed=1).from_output(
+        trader_output
+    )
+
+    assert len(result) == 2500
+    assert list(result.columns) == ["pnl", "drawdown_max", "failure_row_max"]
+    # shuffling keeps the sum
+    assert np.allclose(result["pnl"], float(stats.pnl))
+    # the whole loss is a drawdown
+    assert (result["drawdown_max"] >= -float(stats.pnl) - 1e-9).all()
+    assert result["failure_row_max"].between(1, stats.failure_n).all()
+
+
+def test_block(trader_output):
+    result = MonteCarloFactory(
+        commission=None, paths=100, method="block", block_size=3, seed=1
+    ).from_output(trader_output)
+
+    assert result["pnl"].nunique() > 1
+    assert (result["drawdown_max"] >= 0).all()
+
+
+def test_jobs(trader_output):
+    factory = MonteCarloFactory(commission=None, paths=300, batch_size=100, seed=1)
+    result = factory.from_output(trader_output)
+
+    factory.jobs = 2
+    assert result.equals(factory.from_output(trader_output))
+
+
+def test_no_sessions(output):
+    empty = Output(
+        df=output.df, sessions=Sessions(), signals=output.signals, title=output.title
+    )
+
+    result = MonteCarloFactory(commission=None, paths=10).from_output(empty)
+
+    assert (result == 0).all().all()
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        MonteCarloFactory(commission=None, method="unknown")
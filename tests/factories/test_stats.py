@@ -1,5 +1,10 @@
+import math
+
 from cipher.factories import StatsFactory
-from cipher.models import SimpleCommission
+from cipher.models import Datas, SimpleCommission
+from cipher.trader import Trader
+
+from ..trader.test_run import BracketsStrategy
 
 
 def test_stats(output):
@@ -10,3 +15,53 @@ def test_stats(output):
     assert str(stats.period) == "2d 14h"
     assert str(stats.sessions_n) == "1"
     assert str(stats.pnl) == "2.0116391678622668586"
+
+
+def test_stats_float(ohlc_df, float_numeric):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+    stats = StatsFactory(commission=SimpleCommission("0.001")).from_output(output)
+
+    assert isinstance(stats.pnl, float)
+    assert isinstance(stats.commission, float)
+    assert stats.sessions_n == 106
+    assert "commission" in stats.to_table()
+
+
+def test_stats_risk(ohlc_df):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+    stats = StatsFactory(commission=None, capital=100).from_output(output)
+
+    # the data is hourly without gaps
+    equity = output.equity["balance"] + 100
+    returns = equity.pct_change().dropna()
+    periods_per_year = 365 * 24
+    drawdown = equity / equity.cummax() - 1
+    cagr = (equity.iat[-1] / equity.iat[0]) ** (periods_per_year / len(returns)) - 1
+
+    assert math.isclose(
+        float(stats.volatility), returns.std() * math.sqrt(periods_per_year)
+    )
+    assert math.isclose(
+        float(stats.sharpe),
+        returns.mean() / returns.std() * math.sqrt(periods_per_year),
+    )
+    assert float(stats.sortino) < float(stats.sharpe) < 0
+    assert math.isclose(float(stats.cagr), cagr)
+    assert math.isclose(float(stats.calmar), cagr / -drawdown.min())
+    assert math.isclose(float(stats.ulcer_index), math.sqrt((drawdown**2).mean()))
+    assert stats.under_water_period_max > 0
+    assert "sharpe" in stats.to_table()
+
+
+def test_stats_risk_without_capital(output):
+    stats = StatsFactory(commission=None).from_output(output)
+
+    assert stats.volatility is None
+    assert stats.sharpe is None
+    assert stats.sortino is None
+    assert stats.cagr is None
+    assert stats.calmar is None
+    assert stats.ulcer_index is None
+    assert stats.under_water_period_max is not None
+    assert "sharpe" not in stats.to_table()
+    assert "under water max" in stats.to_table()
@@ -0,0 +1,57 @@
+import math
+
+import pytest
+
+from cipher.factories import StatsFactory, VectorStatsFactory
+from cipher.models import Datas, Output, Sessions, SimpleCommission
+from cipher.trader import Trader
+
+from ..trader.test_run import BracketsStrategy
+
+
+def assert_same_stats(output, commission, capital=None):
+    stats = VectorStatsFactory(commission=commission, capital=capital).from_output(
+        output
+    )
+    expected = StatsFactory(commission=commission, capital=capital).from_output(output)
+
+    for name, value in expected:
+        result = getattr(stats, name)
+        if value is None or isinstance(value, int):
+            assert result == value, name
+        else:
+            assert math.isclose(float(result), float(value), rel_tol=1e-9), name
+
+
+@pytest.mark.parametrize("commission", [None, SimpleCommission("0.001")])
+def test_vector_stats(ohlc_df, commission):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+
+    assert_same_stats(output, commission=commission)
+
+
+def test_vector_stats_capital(ohlc_df):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+
+    assert_same_stats(output, commission=SimpleCommission("0.001"), capital=100)
+
+
+def test_vector_stats_float(ohlc_df, float_numeric):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+
+    assert_same_stats(output, commission=SimpleCommission("0.001"))
+
+
+def test_vector_stats_fixture(output):
+    assert_same_stats(output, commission=SimpleCommission("0.0025"))
+
+
+def test_vector_stats_no_sessions(output):
+    empty = Output(
+        df=output.df,
+        sessions=Sessions(),
+        signals=output.signals,
+        title=output.title,
+    )
+
+    assert_same_stats(empty, commission=None)
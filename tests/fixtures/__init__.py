@@ -1,5 +1,7 @@
 from .df import df
+from .numeric import float_numeric
+from .ohlc_df import ohlc_df
 from .output import output
 
 
-__all__ = ("df", "output")
+__all__ = ("df", "float_numeric", "ohlc_df", "output")
@@ -0,0 +1,11 @@
+import pytest
+
+from cipher.utils import get_numeric, set_numeric
+
+
+@pytest.fixture
+def float_numeric():
+    numeric = get_numeric()
+    set_numeric("float")
+    yield
+    set_numeric(numeric)
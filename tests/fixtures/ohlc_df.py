@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from pandas import DataFrame, date_range
+
+
+@pytest.fixture
+def ohlc_df():
+    """Random walk hourly candles with sparse entry/exit signals."""
+    n = 2000
+    rng = np.random.default_rng(1)
+
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, n))
+
+    df = DataFrame(
+        {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": rng.uniform(1, 10, n),
+        },
+        index=date_range("2020-01-01", periods=n, freq="h", name="ts"),
+    )
+    df["entry"] = rng.uniform(size=n) < 0.05
+    df["exit"] = rng.uniform(size=n) < 0.02
+
+    return df
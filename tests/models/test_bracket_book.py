@@ -0,0 +1,79 @@
+from decimal import Decimal
+
+import pytest
+
+from cipher.models import BracketBook, Cursor, Session, Time, Wallet
+from cipher.proxies import SessionProxy
+
+
+@pytest.fixture
+def book():
+    return BracketBook()
+
+
+@pytest.fixture
+def cursor():
+    cursor = Cursor()
+    cursor.ts = Time.from_string("2020-01-01T01:01")
+    cursor.price = Decimal(20)
+    return cursor
+
+
+def create_session(cursor, book, position, take_profit, stop_loss):
+    session = SessionProxy(
+        Session(), cursor=cursor, wallet=Wallet(), on_change=book.update
+    )
+    session.position = position
+    session.take_profit = take_profit
+    session.stop_loss = stop_loss
+    return session
+
+
+def test_long(book, cursor):
+    session = create_session(cursor, book, 1, take_profit=25, stop_loss=15)
+
+    assert len(book) == 2
+    assert book.pop_triggered(low=16, high=24) == []
+    assert book.pop_triggered(low=14, high=24) == [session]
+    assert len(book) == 0
+
+    book.update(session)
+    assert book.pop_triggered(low=16, high=26) == [session]
+
+
+def test_short(book, cursor):
+    session = create_session(cursor, book, -1, take_profit=15, stop_loss=25)
+
+    assert book.pop_triggered(low=16, high=24) == []
+    assert book.pop_triggered(low=14, high=24) == [session]
+
+    book.update(session)
+    assert book.pop_triggered(low=16, high=26) == [session]
+
+
+def test_both_triggered(book, cursor):
+    session = create_session(cursor, book, 1, take_profit=25, stop_loss=15)
+
+    assert book.pop_triggered(low=10, high=30) == [session]
+
+
+def test_update(book, cursor):
+    session1 = create_session(cursor, book, 1, take_profit=25, stop_loss=15)
+    session2 = create_session(cursor, book, 1, take_profit=30, stop_loss=10)
+
+    session1.take_profit = 35
+    session2.position = 0
+
+    assert len(book) == 2
+    assert book.pop_triggered(low=16, high=31) == []
+    assert book.pop_triggered(low=14, high=36) == [session1]
+
+
+def test_compact(book, cursor):
+    session = create_session(cursor, book, 1, take_profit=25, stop_loss=15)
+
+    for i in range(200):
+        session.take_profit = 25 + i
+
+    assert len(book) == 2
+    assert len(book._above) < 100
@@ -0,0 +1,74 @@
+import pickle
+from decimal import Decimal
+from operator import attrgetter
+
+import numpy as np
+
+from cipher.models import (
+    Datas,
+    Ledger,
+    Session,
+    SimpleCommission,
+    Time,
+    Transaction,
+    Transactions,
+)
+from cipher.trader import Trader
+from ..trader.test_run import BracketsStrategy
+
+
+def create_session(*rows) -> Session:
+    return Session(
+        transactions=Transactions(
+            Transaction(ts=Time(ts), base=Decimal(base), quote=Decimal(quote))
+            for ts, base, quote in rows
+        )
+    )
+
+
+def test_from_sessions():
+    sessions = [
+        create_session((3600, "1", "-10"), (10800, "-1", "12")),
+        create_session((7200, "2", "-22")),
+    ]
+
+    ledger = Ledger.from_sessions(sessions)
+
+    assert len(ledger) == 3
+    assert ledger.ts.tolist() == [3600, 7200, 10800]
+    assert ledger.session_id.tolist() == [0, 1, 0]
+    assert ledger.for_session(0).tolist() == [0, 2]
+    assert ledger.transactions[1] is sessions[1].transactions[0]
+
+    closed = ledger.filter(attrgetter("is_closed"))
+    assert closed.sessions == [sessions[0]]
+    assert closed.session_id.tolist() == [0, 0]
+
+    joined = Ledger.concat([closed, ledger.filter(attrgetter("is_open"))])
+    assert joined.ts.tolist() == [3600, 10800, 7200]
+    assert joined.session_id.tolist() == [0, 0, 1]
+
+    restored = pickle.loads(pickle.dumps(ledger))
+    assert restored.ts.tolist() == ledger.ts.tolist()
+    assert restored.sessions == ledger.sessions
+
+
+def test_trader_ledger(ohlc_df):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+    ledger = output.ledger
+    merged = Ledger.from_sessions(output.sessions)
+
+    assert len(ledger) == 246
+    assert np.all(np.diff(ledger.ts) >= 0)
+    assert sorted(map(id, ledger.transactions)) == sorted(map(id, merged.transactions))
+    assert np.isclose(ledger.quote.sum(), float(sum(s.quote for s in output.sessions)))
+
+    commission = SimpleCommission("0.001")
+    assert np.allclose(
+        commission.for_ledger(ledger),
+        [float(commission.for_transaction(t)) for t in ledger.transactions],
+    )
+
+    fees = ledger.fees(output.df.index, commission=commission)
+    assert fees[0] == 0
+    assert np.isclose(fees[-1], commission.for_ledger(ledger).sum())
@@ -0,0 +1,35 @@
+from cipher.models import Cursor, OpenSessions, Session, Time, Wallet
+from cipher.proxies import SessionProxy
+
+
+def test_open_sessions():
+    cursor = Cursor()
+    cursor.ts = Time.from_string("2020-01-01T01:01")
+    cursor.price = 20
+
+    open_sessions = OpenSessions()
+
+    def create_session():
+        return SessionProxy(
+            Session(), cursor=cursor, wallet=Wallet(), on_change=open_sessions.update
+        )
+
+    session1 = create_session()
+    session2 = create_session()
+    session3 = create_session()
+
+    session1.position += 1
+    session2.position += 1
+    assert len(open_sessions) == 0
+
+    open_sessions.add(session1)
+    open_sessions.add(session2)
+    assert list(open_sessions) == [session1, session2]
+
+    session1.position = 0
+    session3.position -= 1
+    assert list(open_sessions) == [session2]
+
+    open_sessions.add(session3)
+    session1.position += 1
+    assert list(open_sessions) == [session1, session2, session3]
@@ -0,0 +1,44 @@
+import pytest
+from pandas import DataFrame, Series, isna
+
+from cipher.models import Rows
+
+
+@pytest.fixture
+def rows():
+    return Rows(
+        DataFrame(
+            {
+                "close": [1.5, 2.5, 3.5],
+                "entry": Series([True, None, False], dtype="boolean"),
+            }
+        )
+    )
+
+
+def test_rows(rows):
+    assert len(rows) == 3
+    assert [row["close"] for row in rows] == [1.5, 2.5, 3.5]
+
+
+def test_row(rows):
+    row = rows[0]
+
+    assert row["close"] == 1.5
+    assert row["entry"] is True
+    assert row.get("missing") is None
+    assert "close" in row
+    assert list(row) == ["close", "entry"]
+    assert dict(row) == {"close": 1.5, "entry": True}
+
+    with pytest.raises(KeyError):
+        row["missing"]
+
+
+def test_row_null(rows):
+    assert isna(rows[-2]["entry"])
+
+
+def test_rows_out_of_range(rows):
+    with pytest.raises(IndexError):
+        rows[3]
@@ -1,4 +1,8 @@
-from cipher.models import Cursor, Session, Sessions, Time, Wallet
+import numpy as np
+import pandas as pd
+import pytest
+
+from cipher.models import Cursor, Session, Sessions, SimpleCommission, Time, Wallet
 from cipher.proxies import SessionProxy
 
 
@@ -51,3 +55,45 @@ def test_transactions():
         Time(1577844060),
         Time(1577847600),
     ]
+
+
+def test_to_df():
+    session1 = create_session()
+    session1.position += 2
+    session1.meta["reason"] = "breakout"
+    session1._cursor.ts = Time.from_string("2020-01-01T02:01")
+    session1._cursor.price = 25
+    session1.position -= 1
+    session1._cursor.price = 30
+    session1.position = 0
+
+    session2 = create_session()
+    session2.position -= 1
+
+    sessions = Sessions([session1, session2], commission=SimpleCommission("0.01"))
+    df = sessions.to_df()
+
+    assert df["side"].tolist() == ["long", "short"]
+    assert df["duration"].iat[0] == np.timedelta64(3600, "s")
+    assert pd.isna(df["closed_ts"].iat[1])
+    assert df["entry_price"].tolist() == [20.0, 20.0]
+    assert df["exit_price"].iat[0] == 27.5
+    assert np.isnan(df["exit_price"].iat[1])
+    assert df["fees"].iat[0] == pytest.approx(0.95)
+    assert df["pnl"].iat[0] == pytest.approx(15 - 0.95)
+    assert np.isnan(df["pnl"].iat[1])
+    assert df["meta_reason"].iat[0] == "breakout"
+
+
+def test_to_table():
+    sessions = Sessions()
+    for _ in range(25):
+        session = create_session()
+        session.position += 1
+        session.position = 0
+        sessions.append(session)
+
+    table = sessions.to_table()
+
+    assert "..." in table
+    assert len(table.splitlines()) == 2 + 21
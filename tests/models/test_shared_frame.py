@@ -0,0 +1,52 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from cipher.models import SharedFrame
+
+
+def test_shared_frame(ohlc_df):
+    frame = SharedFrame(ohlc_df)
+    attached = pickle.loads(pickle.dumps(frame))
+
+    assert_frame_equal(attached.to_df(), ohlc_df, check_freq=False)
+
+    df = attached.to_df()
+    df["signal"] = True
+    df.loc[df.index[0], "close"] = 0.0
+
+    assert "signal" not in attached.to_df().columns
+    assert attached.to_df()["close"].iloc[0] == ohlc_df["close"].iloc[0]
+
+    attached.close()
+    assert os.path.exists(frame.path)
+
+    frame.close()
+    assert not os.path.exists(frame.path)
+
+
+def is_mapped(values: np.ndarray) -> bool:
+    while isinstance(values, np.ndarray):
+        if isinstance(values, np.memmap):
+            return True
+        values = values.base
+    return False
+
+
+def test_shared_frame_zero_copy(ohlc_df):
+    with SharedFrame(ohlc_df) as frame:
+        df = frame.to_df()
+
+        assert list(df.columns) == list(ohlc_df.columns)
+        assert is_mapped(df.index.to_numpy())
+        for column in df.columns:
+            assert is_mapped(df[column].to_numpy()), column
+
+
+def test_shared_frame_unsupported_dtype():
+    with pytest.raises(ValueError):
+        SharedFrame(DataFrame({"symbol": ["BTCUSDT"]}))
@@ -1,7 +1,6 @@
 from decimal import Decimal
 
 import pytest
-from pydantic import ValidationError
 
 from cipher.models import Time, Transaction
 
@@ -11,7 +10,7 @@ def test_transaction():
         ts=Time.from_string("2020-01-01T01:01"), base=Decimal(1), quote=Decimal(20)
     )
 
-    with pytest.raises(ValidationError):
+    with pytest.raises(AttributeError):
         transaction.base = Decimal(2)
 
     assert transaction.price == Decimal(20)
@@ -0,0 +1,66 @@
+import pickle
+from decimal import Decimal
+
+from cipher.models import Time, Transaction, Transactions
+
+
+def create_transaction(base: str, price: str) -> Transaction:
+    return Transaction(
+        ts=Time(1643400000),
+        base=Decimal(base),
+        quote=-Decimal(base) * Decimal(price),
+    )
+
+
+def test_running_totals():
+    transactions = Transactions()
+
+    assert transactions.base == 0
+    assert transactions.quote == 0
+
+    transactions.append(create_transaction("0.5", "100"))
+    transactions.extend([create_transaction("0.5", "110")])
+    transactions += [create_transaction("-1", "120")]
+
+    assert transactions.base == 0
+    assert transactions.quote == Decimal("15")
+
+
+def test_recount():
+    transactions = Transactions(
+        [create_transaction("1", "100"), create_transaction("-0.5", "120")]
+    )
+
+    assert transactions.base == Decimal("0.5")
+
+    transactions.pop()
+    assert transactions.base == Decimal("1")
+    assert transactions.quote == Decimal("-100")
+
+    transactions[0] = create_transaction("2", "100")
+    assert transactions.base == Decimal("2")
+
+    del transactions[0]
+    assert transactions.base == 0
+
+
+def test_pickle():
+    transactions = Transactions([create_transaction("1", "100")])
+
+    restored = pickle.loads(pickle.dumps(transactions))
+
+    assert restored == transactions
+    assert restored.base == Decimal("1")
+    assert restored.quote == Decimal("-100")
+
+
+def test_to_df():
+    transactions = Transactions(
+        [create_transaction("0.5", "100"), create_transaction("-0.5", "110")]
+    )
+
+    df = transactions.to_df()
+
+    assert list(df.columns) == ["ts", "base", "quote", "price"]
+    assert str(df["ts"].dtype) == "datetime64[s]"
+    assert df["price"].tolist() == [100.0, 110.0]
@@ -66,4 +66,198 @@ def test_load():
         )
 
     assert "fake_ohlc/btcusdt_1h/1579494600.csv" in str(e.value)
-    assert "fake_ohlc/btcusdt_1h/1578600000_1580396400.csv" in str(e.value)
+
+
+class WritingSource(FakeOHLCSource):
+    def load(self, ts: Time, path: Path) -> (Time, Time, bool):
+        if self.raise_error:
+            raise AssertionError("Should not be called!")
+
+        path.write_text("ts,close\n1578600000,1\n1580396400,2\n")
+        return (
+            Time(1578600000),
+            Time(1580396400),
+            True,
+        )
+
+
+def test_load_updates_manifest(tmp_path):
+    service = DataService(cache_root=tmp_path)
+    service.load_df(
+        source=WritingSource(),
+        start_ts=Time(1578600000),
+        stop_ts=Time(1580396400),
+    )
+
+    service = DataService(cache_root=tmp_path)
+    result = service.load_df(
+        source=WritingSource(raise_error=True),
+        start_ts=Time(1578600000),
+        stop_ts=Time(1580396400),
+    )
+
+    assert result.shape == (1, 1)
+    assert (tmp_path / "fake_ohlc/btcusdt_1h/manifest.json").exists()
+
+
+def test_convert_csv_cache(tmp_path):
+    root = tmp_path / "fake_ohlc/btcusdt_1h"
+    root.mkdir(parents=True)
+    (root / "1578600000_1580396400.csv").write_text(
+        "ts,close,trades_number\n1578600000,1,3\n1580396400,2,4\n"
+    )
+
+    service = DataService(cache_root=tmp_path, compression=True)
+    result = service.load_df(
+        source=WritingSource(raise_error=True),
+        start_ts=Time(1578600000),
+        stop_ts=Time(1580396400),
+    )
+
+    assert result["close"].dtype == "float64"
+    assert result["trades_number"].dtype == "int64"
+    assert result.index.dtype == "datetime64[s]"
+    assert sorted(p.name for p in root.iterdir()) == [
+        "1578600000_1580396400.npz",
+        "manifest.json",
+    ]
+
+
+def write_csv_chunk(root: Path, first_ts: int, last_ts: int):
+    rows = "".join(f"{ts},{ts % 7}\n" for ts in range(first_ts, last_ts + 1, 3600))
+    (root / f"{first_ts}_{last_ts}.csv").write_text("ts,close\n" + rows)
+
+
+def test_compact(tmp_path):
+    root = tmp_path / "fake_ohlc/btcusdt_1h"
+    root.mkdir(parents=True)
+    # 2020-01-01, two adjacent chunks, a gap, then a chunk in February
+    write_csv_chunk(root, 1577836800, 1577836800 + 9 * 3600)
+    write_csv_chunk(root, 1577836800 + 10 * 3600, 1577836800 + 19 * 3600)
+    write_csv_chunk(root, 1577836800 + 30 * 3600, 1577836800 + 39 * 3600)
+    write_csv_chunk(root, 1580515200, 1580515200 + 9 * 3600)
+
+    service = DataService(cache_root=tmp_path)
+    before = service.load_df(
+        source=WritingSource(raise_error=True),
+        start_ts=Time(1577836800),
+        stop_ts=Time(1577836800 + 19 * 3600),
+    )
+
+    assert service.compact() == 1
+    assert sorted(p.name for p in root.iterdir()) == [
+        "1577836800_1577905200.npz",
+        "1577944800_1577977200.npz",
+        "1580515200_1580547600.npz",
+        "manifest.json",
+    ]
+
+    service = DataService(cache_root=tmp_path)
+    after = service.load_df(
+        source=WritingSource(raise_error=True),
+        start_ts=Time(1577836800),
+        stop_ts=Time(1577836800 + 19 * 3600),
+    )
+
+    assert after.equals(before)
+    assert service.compact() == 0
+
+
+class PagedSource(FakeOHLCSource):
+    page_size = 3600 * 10
+
+    def __init__(self, last_ts: int):
+        super().__init__()
+        self.last_ts = last_ts
+        self.calls = 0
+
+    def load(self, ts: Time, path: Path) -> (Time, Time, bool):
+        self.calls += 1
+        first_ts = ts.block_ts(self.page_size)
+        last_ts = min(first_ts + self.page_size - 3600, self.last_ts)
+        rows = "".join(f"{t},{t % 7}\n" for t in range(first_ts, last_ts + 1, 3600))
+        path.write_text("ts,close\n" + rows)
+
+        return (
+            Time(first_ts),
+            Time(last_ts),
+            last_ts == first_ts + self.page_size - 3600,
+        )
+
+
+def test_load_pages(tmp_path):
+    start_ts = Time(1577836800)
+    source = PagedSource(last_ts=start_ts + 3600 * 399)
+    service = DataService(cache_root=tmp_path, jobs=1)
+
+    result = service.load_df(
+        source=source, start_ts=start_ts + 3600 * 5, stop_ts=start_ts + 3600 * 355
+    )
+
+    assert len(result) == 350
+    assert result.index.is_unique and result.index.is_monotonic_increasing
+    assert source.calls == 36
+
+    service.compact()
+    source.calls = 0
+    result = service.load_df(
+        source=source, start_ts=start_ts, stop_ts=start_ts + 3600 * 1000
+    )
+
+    assert len(result) == 400
+    assert source.calls == 5
+
+
+def test_load_pages_concurrently(tmp_path):
+    start_ts = Time(1577836800)
+    expected = DataService(cache_root=tmp_path / "sequential", jobs=1).load_df(
+        source=PagedSource(last_ts=start_ts + 3600 * 399),
+        start_ts=start_ts,
+        stop_ts=start_ts + 3600 * 1000,
+    )
+
+    service = DataService(cache_root=tmp_path / "concurrent", jobs=4)
+    result = service.load_df(
+        source=PagedSource(last_ts=start_ts + 3600 * 399),
+        start_ts=start_ts,
+        stop_ts=start_ts + 3600 * 1000,
+    )
+
+    assert result.equals(expected)
+    root = tmp_path / "concurrent/fake_ohlc/btcusdt_1h"
+    assert sorted(p.name for p in root.iterdir()) == sorted(
+        p.name for p in (tmp_path / "sequential/fake_ohlc/btcusdt_1h").iterdir()
+    )
+
+
+class WidePagedSource(PagedSource):
+    """The first page returns three pages of rows, like a listing start."""
+
+    def load(self, ts: Time, path: Path) -> (Time, Time, bool):
+        if ts.block_ts(self.page_size) != 1577836800:
+            return super().load(ts=ts, path=path)
+
+        self.calls += 1
+        last_ts = 1577836800 + 3 * self.page_size - 3600
+        rows = "".join(f"{t},{t % 7}\n" for t in range(1577836800, last_ts + 1, 3600))
+        path.write_text("ts,close\n" + rows)
+
+        return Time(1577836800), Time(last_ts), True
+
+
+def test_load_pages_covered_ahead(tmp_path):
+    start_ts = Time(1577836800)
+    kwargs = dict(start_ts=start_ts, stop_ts=start_ts + 3600 * 100)
+
+    expected = DataService(cache_root=tmp_path / "sequential", jobs=1).load_df(
+        source=WidePagedSource(last_ts=start_ts + 3600 * 399), **kwargs
+    )
+    source = WidePagedSource(last_ts=start_ts + 3600 * 399)
+    result = DataService(cache_root=tmp_path / "concurrent", jobs=4).load_df(
+        source=source, **kwargs
+    )
+
+    assert len(expected) == 100
+    assert result.equals(expected)
+    # pages 1 and 2 may be fetched ahead, never more than jobs extra
+    assert source.calls <= 8 + 3
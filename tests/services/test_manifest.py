@@ -0,0 +1,49 @@
+from cipher.services.manifest import Chunk, Manifest
+
+
+def test_find(tmp_path):
+    manifest = Manifest(tmp_path)
+    manifest.add(Chunk(100, 199, "100_199.csv", True))
+    manifest.add(Chunk(0, 99, "0_99.csv", True))
+    manifest.add(Chunk(200, 250, "200_.csv", False))
+
+    assert manifest.find(-1) is None
+    assert manifest.find(0).name == "0_99.csv"
+    assert manifest.find(150.5).name == "100_199.csv"
+    assert manifest.find(199).name == "100_199.csv"
+    assert manifest.find(220) is None
+
+
+def test_find_overlapping(tmp_path):
+    manifest = Manifest(tmp_path)
+    manifest.add(Chunk(0, 1000, "0_1000.csv", True))
+    manifest.add(Chunk(100, 199, "100_199.csv", True))
+
+    assert manifest.find(500).name == "0_1000.csv"
+
+
+def test_add_completes(tmp_path):
+    manifest = Manifest(tmp_path)
+    manifest.add(Chunk(0, 50, "0_.csv", False))
+    manifest.add(Chunk(0, 99, "0_99.csv", True))
+
+    assert manifest.chunks == [Chunk(0, 99, "0_99.csv", True)]
+
+
+def test_save(tmp_path):
+    manifest = Manifest(tmp_path)
+    manifest.add(Chunk(0, 99, "0_99.csv", True))
+    manifest.save()
+
+    assert Manifest(tmp_path).chunks == manifest.chunks
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+
+def test_scan(tmp_path):
+    for name in ("0_99.csv", "100_.csv", "200.csv", "notes.txt"):
+        (tmp_path / name).touch()
+
+    manifest = Manifest(tmp_path)
+
+    assert manifest.chunks == [Chunk(0, 99, "0_99.csv", True)]
+    assert (tmp_path / "manifest.json").exists()
@@ -0,0 +1,37 @@
+from cipher import SignalStrategy, percent
+from cipher.models import Datas, SimpleCommission
+from cipher.sweep import Sweep
+
+
+class BracketsStrategy(SignalStrategy):
+    def __init__(self, take_profit, stop_loss):
+        self.take_profit = percent(take_profit)
+        self.stop_loss = percent(stop_loss)
+
+
+def test_sweep(ohlc_df):
+    sweep = Sweep(
+        strategy_cls=BracketsStrategy,
+        datas=Datas([ohlc_df]),
+        commission=SimpleCommission("0.001"),
+    )
+
+    result = sweep.run({"take_profit": [1, 2], "stop_loss": [-1, -2, -3]})
+
+    assert len(result) == 6
+    assert list(result.columns[:3]) == ["take_profit", "stop_loss", "start_ts"]
+    assert result["sessions_n"].min() > 50
+    assert result["pnl"].nunique() == 6
+
+
+def test_sweep_jobs(ohlc_df):
+    param_grid = {"take_profit": [1, 2], "stop_loss": [-1, -2]}
+
+    result = Sweep(strategy_cls=BracketsStrategy, datas=Datas([ohlc_df]), jobs=1).run(
+        param_grid
+    )
+    result_jobs = Sweep(
+        strategy_cls=BracketsStrategy, datas=Datas([ohlc_df]), jobs=2
+    ).run(param_grid)
+
+    assert result.equals(result_jobs)
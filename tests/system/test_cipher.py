@@ -1,7 +1,13 @@
+from decimal import Decimal
+
 from cipher import Cipher, Strategy
+from cipher.factories import StatsFactory
+from cipher.models import Datas
+from cipher.utils import get_numeric
 
 from .. import DATA_PATH
 from ..services.test_data import FakeOHLCSource
+from ..trader.test_run import BracketsStrategy
 
 
 class MyStrategy(Strategy):
@@ -16,3 +22,42 @@ def test_cipher():
     cipher.run(start_ts="2020-01-01", stop_ts="2020-01-02")
 
     assert cipher.stats
+
+
+def test_cipher_sweep():
+    cipher = Cipher(cache_root=DATA_PATH / "sources_cache")
+
+    cipher.add_source(FakeOHLCSource())
+    result = cipher.sweep(
+        MyStrategy, param_grid={}, start_ts="2020-01-01", stop_ts="2020-01-02"
+    )
+
+    assert len(result) == 1
+
+
+def test_cipher_numerics(ohlc_df, monkeypatch):
+    monkeypatch.setattr(
+        Cipher, "_load_datas", lambda self, start_ts, stop_ts: Datas([ohlc_df.copy()])
+    )
+
+    float_cipher = Cipher(cache_root=DATA_PATH / "sources_cache", numeric="float")
+    float_cipher.set_strategy(BracketsStrategy())
+    float_cipher.add_source(FakeOHLCSource())
+    float_cipher.set_commission("0.001")
+    float_cipher.run(start_ts="2020-01-01", stop_ts="2020-04-01")
+
+    # built after the run, does not change the numeric of the first one
+    decimal_cipher = Cipher(cache_root=DATA_PATH / "sources_cache")
+    decimal_cipher.set_strategy(BracketsStrategy())
+    decimal_cipher.add_source(FakeOHLCSource())
+    decimal_cipher.set_commission("0.001")
+    decimal_cipher.run(start_ts="2020-01-01", stop_ts="2020-04-01")
+
+    float_stats = float_cipher.stats
+    assert float_stats.sessions_n == 106
+    assert isinstance(float_stats.pnl, float)
+    assert isinstance(decimal_cipher.stats.pnl, Decimal)
+    assert isinstance(
+        StatsFactory(commission=None).from_output(float_cipher.output).pnl, float
+    )
+    assert isinstance(get_numeric().zero, Decimal)
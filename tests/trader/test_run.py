@@ -0,0 +1,166 @@
+from decimal import Decimal
+
+import numpy as np
+from pandas.testing import assert_frame_equal
+
+from cipher import Strategy, percent
+from cipher.models import (
+    BracketBook,
+    Datas,
+    Row,
+    Session,
+    Time,
+    Transaction,
+    Transactions,
+)
+from cipher.trader import Trader
+
+
+class BracketsStrategy(Strategy):
+    def on_entry(self, row, session):
+        if row["close"] > row["open"]:
+            session.position += 1
+            session.take_profit = percent(2)
+            session.stop_loss = percent(-1)
+        else:
+            session.position -= 1
+            session.take_profit = percent(-2)
+            session.stop_loss = percent(1)
+
+    def on_take_profit(self, row, session):
+        if session.meta.get("partial"):
+            session.position = 0
+        else:
+            session.meta["partial"] = True
+            session.position *= 0.5
+            session.take_profit = percent(1) if session.is_long else percent(-1)
+
+    def on_exit(self, row, session):
+        session.position = 0
+
+
+class RowsStrategy(Strategy):
+    def __init__(self):
+        self.rows = []
+
+    def on_step(self, row, session):
+        self.rows.append(row)
+
+
+def test_run(ohlc_df):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+
+    closed_sessions = output.sessions.closed_sessions
+
+    assert output.signals == ["entry", "exit"]
+    assert len(output.sessions) == 106
+    assert len(closed_sessions) == 106
+    assert sum(len(s.transactions) for s in output.sessions) == 246
+    assert sum(s.quote for s in closed_sessions) == Decimal("-2.0242640000")
+
+
+def test_run_equity(ohlc_df):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+    equity = output.equity
+
+    assert equity.index.equals(output.df.index)
+    assert equity["position"].iat[0] == 0
+    assert equity["position"].iat[-1] == 0
+    assert np.isclose(equity["balance"].iat[-1], -2.024264)
+    assert_frame_equal(
+        equity,
+        output.ledger.equity(
+            output.df.index, close=output.df["close"].to_numpy(dtype=np.float64)
+        ),
+    )
+
+
+def test_schedule():
+    trader = Trader(datas=Datas(), strategy=Strategy())
+    book = BracketBook()
+    lows = np.array([9.0, 8.0, 9.0, 9.0, 5.0, 9.0])
+    highs = np.array([11.0, 11.0, 11.0, 11.0, 11.0, 11.0])
+
+    schedule = trader._schedule(
+        events=np.array([0, 2]), bracket_book=book, lows=lows, highs=highs
+    )
+
+    assert next(schedule) == 0
+    assert next(schedule) == 2
+
+    session = Session(
+        transactions=Transactions(
+            [Transaction(ts=Time(0), base=Decimal(1), quote=Decimal(-10))]
+        ),
+        stop_loss=Decimal(6),
+    )
+    book.update(session)
+
+    assert next(schedule) == 4
+    assert list(schedule) == []
+
+
+def test_run_rows(ohlc_df):
+    strategy = RowsStrategy()
+
+    Trader(datas=Datas([ohlc_df]), strategy=strategy).run()
+
+    row = strategy.rows[-1]
+    assert isinstance(row, Row)
+    assert len(strategy.rows) == len(ohlc_df)
+    assert row["close"] == ohlc_df["close"].iloc[-1]
+    assert dict(row) == ohlc_df.iloc[-1].to_dict()
+
+
+class DenseBracketsStrategy(BracketsStrategy):
+    def on_step(self, row, session):
+        pass
+
+
+def test_run_sparse(ohlc_df):
+    sparse_trader = Trader(datas=Datas([ohlc_df.copy()]), strategy=BracketsStrategy())
+    dense_trader = Trader(
+        datas=Datas([ohlc_df.copy()]), strategy=DenseBracketsStrategy()
+    )
+
+    assert not sparse_trader._has_on_step()
+    assert dense_trader._has_on_step()
+
+    sparse_sessions = sparse_trader.run().sessions
+    dense_sessions = dense_trader.run().sessions
+
+    assert [s.transactions for s in sparse_sessions] == [
+        s.transactions for s in dense_sessions
+    ]
+
+
+class IntegerStopLossStrategy(Strategy):
+    def on_entry(self, row, session):
+        session.position += 1
+        session.stop_loss = row["low"] - 1
+        session.take_profit = row["high"] + 1
+
+    def on_exit(self, row, session):
+        session.position = 0
+
+
+def test_run_integer_prices(ohlc_df):
+    df = ohlc_df.copy()
+    for column in ("open", "high", "low", "close"):
+        df[column] = (df[column] * 100).round().astype("int64")
+
+    output = Trader(datas=Datas([df]), strategy=IntegerStopLossStrategy()).run()
+
+    transaction = output.sessions[0].transactions[0]
+    assert len(output.sessions.closed_sessions) > 50
+    assert transaction.quote == -int(df["close"][df["entry"]].iloc[0])
+
+
+def test_run_float(ohlc_df, float_numeric):
+    output = Trader(datas=Datas([ohlc_df]), strategy=BracketsStrategy()).run()
+
+    closed_sessions = output.sessions.closed_sessions
+
+    assert len(closed_sessions) == 106
+    assert isinstance(closed_sessions[0].transactions[0].quote, float)
+    assert abs(sum(s.quote for s in closed_sessions) - -2.024264) < 0.1
@@ -1,5 +1,7 @@
 from decimal import Decimal
 
+import numpy as np
+
 from cipher.utils import float_to_decimal
 
 
@@ -9,3 +11,5 @@ def test_float_to_decimal():
     assert float_to_decimal(1.2) == Decimal("1.2")
     assert float_to_decimal(1.0 / 3) == Decimal("0.3333")
     assert float_to_decimal(0.000567123) == Decimal("0.0005671")
+    assert float_to_decimal(np.int64(7213)) == Decimal(7213)
+    assert float_to_decimal(np.float32(0.5)) == Decimal("0.5")
@@ -0,0 +1,40 @@
+from decimal import Decimal
+
+from cipher import percent
+from cipher.models import Time, Transaction, Transactions, Wallet
+from cipher.utils import get_numeric, price_to_number, to_number, use_numeric
+
+
+def test_numeric():
+    assert to_number("10.1") == Decimal("10.1")
+    assert price_to_number(1.23456) == Decimal("1.23")
+    assert isinstance(percent(1).value, Decimal)
+
+
+def test_float_numeric(float_numeric):
+    assert get_numeric().zero == 0.0
+    assert to_number("10.1") == 10.1
+    assert price_to_number(1.23456) == 1.23456
+    assert percent(1).value == 1.0
+
+    transaction = Transaction(ts=Time(0), base=to_number(2), quote=to_number(-3))
+    assert isinstance(transaction.quote, float)
+
+    wallet = Wallet()
+    wallet.apply(transaction)
+    assert wallet.quote == -3.0
+
+
+
+def test_use_numeric():
+    with use_numeric("float"):
+        assert to_number("10.1") == 10.1
+        transactions = Transactions(
+            [Transaction(ts=Time(0), base=to_number(1), quote=to_number(-2))]
+        )
+
+    assert isinstance(get_numeric().zero, Decimal)
+
+    transactions.insert(0, Transaction(ts=Time(0), base=1.0, quote=-1.0))
+    assert transactions.quote == -3.0
+    assert isinstance(transactions.quote, float)
@@ -1,4 +1,8 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
 
 from cipher.utils import RateLimiter
 
@@ -17,3 +21,21 @@ def test_rate_limiter():
     assert times[0] < 0.1
     assert times[1] > 0.2
     assert times[2] > 0.2
+
+
+def test_rate_limiter_threads():
+    with patch("cipher.utils.rate_limit.time") as clock:
+        clock.monotonic.return_value = 100.0
+        rate_limiter = RateLimiter(calls_per_seconds=20.0)
+
+        def call():
+            with rate_limiter():
+                pass
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(8):
+                executor.submit(call)
+
+    # the clock stands still, each call waits for its own slot
+    waits = sorted(c.args[0] for c in clock.sleep.call_args_list)
+    assert waits == pytest.approx([0.05 * n for n in range(1, 8)])
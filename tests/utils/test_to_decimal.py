@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from decimal import Decimal
@@ -10,6 +11,8 @@ def test_to_decimal():
     assert to_decimal("10.1") == Decimal("10.1")
     assert to_decimal(1) == Decimal(1)
     assert to_decimal(1.5) == Decimal("1.5")
+    assert to_decimal(np.int64(7)) == Decimal(7)
+    assert to_decimal(np.float64(1.5)) == Decimal("1.5")
 
     with pytest.raises(ValueError):
         to_decimal([])
@@ -0,0 +1,107 @@
+import pytest
+
+from decimal import Decimal
+
+import numpy as np
+
+from cipher import SignalStrategy, Strategy, TargetPositionStrategy, percent, quote
+from cipher.models import Datas
+from cipher.trader import Trader
+from cipher.vector_trader import VectorTrader
+
+
+class LongStrategy(SignalStrategy):
+    take_profit = percent(2)
+    stop_loss = percent(-1)
+
+
+class ShortStrategy(SignalStrategy):
+    position = quote(-100)
+    take_profit = percent(-1)
+    stop_loss = percent("0.5")
+
+
+class ExitOnlyStrategy(SignalStrategy):
+    position = "0.5"
+
+
+class TargetStrategy(TargetPositionStrategy):
+    def compose(self):
+        df = self.datas.df
+        mean = df["close"].rolling(20).mean()
+        df["target_position"] = np.sign(df["close"] - mean) * np.where(
+            df["close"] > df["open"], 2, 1
+        )
+        return df
+
+
+class EquityTargetStrategy(TargetStrategy):
+    equity = Decimal(1000)
+
+    def compose(self):
+        df = super().compose()
+        df["target_position"] /= 4
+        return df
+
+
+class ExtraSignalStrategy(SignalStrategy):
+    def on_my_signal(self, row, session):
+        pass
+
+
+@pytest.mark.parametrize(
+    "strategy_cls", [LongStrategy, ShortStrategy, ExitOnlyStrategy]
+)
+def test_run(ohlc_df, strategy_cls):
+    strategy = strategy_cls()
+    output = VectorTrader(datas=Datas([ohlc_df.copy()]), strategy=strategy).run()
+
+    trader_strategy = strategy_cls()
+    trader_output = Trader(
+        datas=Datas([ohlc_df.copy()]), strategy=trader_strategy
+    ).run()
+
+    assert len(output.sessions) > 50
+    assert output.sessions == trader_output.sessions
+    assert output.signals == trader_output.signals
+    assert output.title == trader_output.title
+    assert strategy.wallet.base == trader_strategy.wallet.base
+    assert strategy.wallet.quote == trader_strategy.wallet.quote
+
+
+def test_run_target_position(ohlc_df):
+    output = VectorTrader(
+        datas=Datas([ohlc_df.copy()]), strategy=TargetStrategy()
+    ).run()
+    trader_output = Trader(
+        datas=Datas([ohlc_df.copy()]), strategy=TargetStrategy()
+    ).run()
+
+    assert len(output.sessions) > 100
+    assert output.sessions == trader_output.sessions
+    assert output.sessions.open_sessions == output.sessions[-1:]
+    for session in output.sessions:
+        positions = np.cumsum([t.base for t in session.transactions])
+        assert all(positions[:-1] > 0) if session.is_long else all(positions[:-1] < 0)
+
+
+def test_run_target_position_equity(ohlc_df):
+    strategy = EquityTargetStrategy()
+    output = VectorTrader(datas=Datas([ohlc_df.copy()]), strategy=strategy).run()
+
+    trader_strategy = EquityTargetStrategy()
+    trader_output = Trader(
+        datas=Datas([ohlc_df.copy()]), strategy=trader_strategy
+    ).run()
+
+    assert len(output.sessions) == len(trader_output.sessions)
+    # the vector trader uses float equity, the difference is caused by the price rounding
+    assert abs(strategy.wallet.quote - trader_strategy.wallet.quote) < Decimal(1)
+
+
+def test_unsupported_strategy(ohlc_df):
+    with pytest.raises(ValueError):
+        VectorTrader(datas=Datas([ohlc_df]), strategy=Strategy()).run()
+
+    with pytest.raises(ValueError):
+        VectorTrader(datas=Datas([ohlc_df]), strategy=ExtraSignalStrategy()).run()
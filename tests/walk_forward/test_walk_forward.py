@@ -0,0 +1,76 @@
+import numpy as np
+
+from cipher import SignalStrategy, percent
+from cipher.factories import StatsFactory
+from cipher.models import Datas
+from cipher.walk_forward import WalkForward
+
+
+class BracketsStrategy(SignalStrategy):
+    def __init__(self, take_profit, stop_loss):
+        self.take_profit = percent(take_profit)
+        self.stop_loss = percent(stop_loss)
+
+
+def test_walk_forward(ohlc_df):
+    output, windows = WalkForward(
+        strategy_cls=BracketsStrategy,
+        datas=Datas([ohlc_df]),
+        train="20D",
+        test="10D",
+    ).run({"take_profit": [1, 2], "stop_loss": [-1, -2]})
+
+    assert len(windows) == 7
+    assert list(windows.columns) == [
+        "train_start",
+        "test_start",
+        "test_stop",
+        "take_profit",
+        "stop_loss",
+    ]
+    assert output.df.index[0] == windows["test_start"].iloc[0]
+    assert output.df.index.is_unique
+    assert all(
+        s.transactions[0].ts.to_datetime() >= windows["test_start"].iloc[0]
+        for s in output.sessions
+    )
+
+    stats = StatsFactory(commission=None).from_output(output)
+    assert stats.sessions_n > 0
+
+
+def test_walk_forward_jobs(ohlc_df):
+    param_grid = {"take_profit": [1, 2], "stop_loss": [-1, -2]}
+    kwargs = dict(
+        strategy_cls=BracketsStrategy, datas=Datas([ohlc_df]), train="20D", test="10D"
+    )
+
+    output, windows = WalkForward(**kwargs, jobs=1).run(param_grid)
+    output_jobs, windows_jobs = WalkForward(**kwargs, jobs=2).run(param_grid)
+
+    assert windows.equals(windows_jobs)
+    assert output.sessions == output_jobs.sessions
+
+
+class SignalsStrategy(SignalStrategy):
+    def __init__(self, position):
+        self.position = position
+
+
+def test_walk_forward_closes_sessions(ohlc_df):
+    rng = np.random.default_rng(2)
+    ohlc_df["exit"] = rng.uniform(size=len(ohlc_df)) < 0.005
+
+    output, windows = WalkForward(
+        strategy_cls=SignalsStrategy,
+        datas=Datas([ohlc_df]),
+        train="20D",
+        test="10D",
+    ).run({"position": [1]})
+
+    index = output.equity.index
+    for test_stop in windows["test_stop"]:
+        last_i = index.searchsorted(test_stop) - 1
+        assert output.equity["position"].iloc[last_i] == 0
+
+    assert not output.sessions.open_sessions